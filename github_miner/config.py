@@ -26,6 +26,7 @@ def get_github_token() -> str:
 DEFAULT_BATCH_SIZE = 5
 DEFAULT_MAX_WORKERS = 2
 RATE_LIMIT_DELAY = 30  # seconds
+GITHUB_PER_PAGE = 100  # GitHub's maximum page size
 
 # Discovery constants
 DEFAULT_DISCOVERY_LIMIT = 50
@@ -5,10 +5,11 @@ This module contains the AutoProfileDiscovery class which provides various metho
 for discovering GitHub profiles based on different criteria and strategies.
 """
 
+import itertools
 from datetime import datetime, timedelta
 from github import Github, GithubException
 from typing import List, Dict, Optional
-from .config import GITHUB_TOKEN, DEFAULT_DISCOVERY_LIMIT, DEFAULT_TOPIC_LIST
+from .config import GITHUB_TOKEN, GITHUB_PER_PAGE, DEFAULT_DISCOVERY_LIMIT, DEFAULT_TOPIC_LIST
 
 
 class AutoProfileDiscovery:
@@ -38,8 +39,24 @@ class AutoProfileDiscovery:
         self.token = github_token or GITHUB_TOKEN
         if not self.token:
             raise ValueError("GitHub token is required")
-        self.github = Github(self.token)
+        self.github = Github(self.token, per_page=GITHUB_PER_PAGE)
         self.headers = {'Authorization': f'token {self.token}'}
+        # login -> profile location; the same people recur across discovery methods
+        self._location_cache = {}
+    
+    def _get_user_location(self, login: str) -> Optional[str]:
+        """
+        Get a user's profile location, fetching each login at most once.
+        
+        Args:
+            login (str): GitHub username
+            
+        Returns:
+            Optional[str]: The profile location, or None if it is not set
+        """
+        if login not in self._location_cache:
+            self._location_cache[login] = self.github.get_user(login).location
+        return self._location_cache[login]
     
     def discover_trending_developers(self, language: str = None, location: str = None, 
                                    limit: int = DEFAULT_DISCOVERY_LIMIT):
@@ -82,8 +99,8 @@ class AutoProfileDiscovery:
                     # Get repository owner
                     if repo.owner and repo.owner.type == "User":
                         if location:
-                            user = self.github.get_user(repo.owner.login)
-                            if user.location and location.lower() in user.location.lower():
+                            user_location = self._get_user_location(repo.owner.login)
+                            if user_location and location.lower() in user_location.lower():
                                 discovered_users.add(repo.owner.login)
                         else:
                             discovered_users.add(repo.owner.login)
@@ -91,15 +108,15 @@ class AutoProfileDiscovery:
                     # Get top contributors
                     try:
                         contributors = repo.get_contributors()
-                        for contributor in list(contributors)[:5]:  # Top 5 contributors
+                        for contributor in itertools.islice(contributors, 5):  # Top 5 contributors
                             if len(discovered_users) >= limit:
                                 break
                             
                             if contributor.type == "User":
                                 if location:
                                     try:
-                                        user = self.github.get_user(contributor.login)
-                                        if user.location and location.lower() in user.location.lower():
+                                        user_location = self._get_user_location(contributor.login)
+                                        if user_location and location.lower() in user_location.lower():
                                             discovered_users.add(contributor.login)
                                     except:
                                         pass
@@ -162,9 +179,8 @@ class AutoProfileDiscovery:
             users = self.github.search_users(query)
             discovered_users = []
             
-            for user in users:
-                if len(discovered_users) >= limit:
-                    break
+            # islice stops before PyGithub requests a page past the limit
+            for user in itertools.islice(users, limit):
                 discovered_users.append(user.login)
             
             print(f"Discovered {len(discovered_users)} users from search criteria")
@@ -212,7 +228,7 @@ class AutoProfileDiscovery:
                             
                             # Add top contributors
                             contributors = repo.get_contributors()
-                            for contributor in list(contributors)[:3]:
+                            for contributor in itertools.islice(contributors, 3):
                                 if len(discovered_users) >= limit:
                                     break
                                 if contributor.type == "User":
@@ -269,7 +285,7 @@ class AutoProfileDiscovery:
                     # Get recent contributors
                     try:
                         contributors = repo.get_contributors()
-                        for contributor in list(contributors)[:3]:
+                        for contributor in itertools.islice(contributors, 3):
                             if len(discovered_users) >= limit:
                                 break
                             if contributor.type == "User":
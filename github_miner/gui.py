@@ -8,13 +8,23 @@ with support for profile mining, repository mining, and automated discovery.
 import tkinter as tk
 from tkinter import messagebox, ttk
 import threading
+import queue
 import time
 import re
 from datetime import datetime
 
 from .discovery import AutoProfileDiscovery
 from .miner import AdvancedGitHubMiner
-from .config import GITHUB_TOKEN, set_github_token
+from .config import GITHUB_TOKEN
+
+# Compiled once rather than on every extract_username() call
+GITHUB_USERNAME_PATTERN = re.compile(r'github\.com/([a-zA-Z0-9-]+)')
+
+# How often the GUI thread drains queued status messages (caps log repaints at 10 Hz)
+STATUS_POLL_MS = 100
+# Messages inserted per drain, and lines kept in the status log
+STATUS_DRAIN_BATCH = 500
+STATUS_MAX_LINES = 5000
 
 
 class GitHubMinerGUI:
@@ -38,6 +48,7 @@ class GitHubMinerGUI:
         self.root.title("GitHub Profile Miner")
         self.stop_event = threading.Event()
         self.mining_thread = None
+        self.token = GITHUB_TOKEN
         
         # Create main frame
         self.main_frame = ttk.Frame(root, padding="10")
@@ -72,9 +83,13 @@ class GitHubMinerGUI:
         self.progress_bar.pack(fill=tk.X, pady=5)
         
         # Status text (shared between tabs)
-        self.status_text = tk.Text(self.main_frame, height=10, width=80)
+        self.status_text = tk.Text(self.main_frame, height=10, width=80, undo=False, maxundo=0)
         self.status_text.pack(pady=10, fill=tk.BOTH, expand=True)
         
+        # Worker threads queue status messages; only the Tk thread touches the widget
+        self.status_queue = queue.Queue()
+        self.root.after(STATUS_POLL_MS, self._drain_status_queue)
+        
         # Control buttons (shared)
         self.control_frame = ttk.Frame(self.main_frame)
         self.control_frame.pack(pady=5)
@@ -354,7 +369,7 @@ class GitHubMinerGUI:
     def auto_discovery_worker(self, discovery_type):
         """Worker for predefined auto discovery."""
         try:
-            token = self.auto_token_entry.get() or self.entry_token.get() or GITHUB_TOKEN
+            token = self.auto_token_entry.get() or self.entry_token.get() or self.token
             if not token:
                 raise ValueError("GitHub token is required")
             
@@ -415,7 +430,7 @@ class GitHubMinerGUI:
     def custom_discovery_worker(self, params):
         """Worker for custom auto discovery."""
         try:
-            token = self.auto_token_entry.get() or self.entry_token.get() or GITHUB_TOKEN
+            token = self.auto_token_entry.get() or self.entry_token.get() or self.token
             if not token:
                 raise ValueError("GitHub token is required")
             
@@ -488,7 +503,7 @@ class GitHubMinerGUI:
     def mine_discovered_users(self, usernames, output_prefix):
         """Mine data for discovered users with immediate saving after each user."""
         try:
-            token = self.auto_token_entry.get() or self.entry_token.get() or GITHUB_TOKEN
+            token = self.auto_token_entry.get() or self.entry_token.get() or self.token
             
             def progress_callback(message):
                 self.update_status(message)
@@ -546,18 +561,31 @@ class GitHubMinerGUI:
         self.status_text.delete(1.0, tk.END)
     
     def update_status(self, message):
-        """Update the status text with a new message."""
-        self.status_text.insert(tk.END, f"[{datetime.now().strftime('%H:%M:%S')}] {message}\n")
-        self.status_text.see(tk.END)
-        self.root.update_idletasks()
+        """Queue a status message; safe to call from worker threads."""
+        self.status_queue.put_nowait(f"[{datetime.now().strftime('%H:%M:%S')}] {message}\n")
+    
+    def _drain_status_queue(self):
+        """Append queued status messages to the log on the Tk thread, then reschedule."""
+        lines = []
+        while len(lines) < STATUS_DRAIN_BATCH:
+            try:
+                lines.append(self.status_queue.get_nowait())
+            except queue.Empty:
+                break
+        if lines:
+            # One insert and one scroll per batch instead of per message
+            self.status_text.insert(tk.END, ''.join(lines))
+            self.status_text.delete('1.0', f'end-{STATUS_MAX_LINES}lines')
+            self.status_text.see(tk.END)
+        self.root.after(STATUS_POLL_MS, self._drain_status_queue)
     
     def set_global_token(self):
-        """Set the global GitHub token."""
+        """Remember the entered token for this GUI session."""
         token = self.entry_token.get() or self.repo_entry_token.get()
         if not token or token.strip() == "":
             messagebox.showerror("Error", "Token cannot be empty")
             return
-        set_github_token(token)
+        self.token = token
         messagebox.showinfo("Success", "Global token has been set!")
     
     def start_profile_mining(self):
@@ -585,7 +613,7 @@ class GitHubMinerGUI:
     def mine_profile(self):
         """Mine a single GitHub profile with immediate saving."""
         try:
-            token = self.entry_token.get()
+            token = self.entry_token.get() or self.token
             profile_url = self.entry_url.get()
             
             username = self.extract_username(profile_url)
@@ -670,7 +698,7 @@ class GitHubMinerGUI:
     def mine_repository(self):
         """Mine repository contributors with immediate saving."""
         try:
-            token = self.repo_entry_token.get()
+            token = self.repo_entry_token.get() or self.token
             repo_url = self.repo_entry_url.get()
             
             if not token or not repo_url:
@@ -778,8 +806,7 @@ class GitHubMinerGUI:
         if not url:
             raise ValueError("Profile URL cannot be empty")
         
-        pattern = r'github\.com/([a-zA-Z0-9-]+)'
-        match = re.search(pattern, url)
+        match = GITHUB_USERNAME_PATTERN.search(url)
         if not match:
             raise ValueError("Invalid GitHub profile URL")
         
@@ -6,8 +6,10 @@ data mining capabilities for GitHub profiles and repositories.
 """
 
 import requests
+import itertools
 import pandas as pd
 import json
+import csv
 from datetime import datetime, timedelta
 import re
 from github import Github, GithubException
@@ -17,7 +19,31 @@ from typing import List, Dict, Optional
 import logging
 import numpy as np
 
-from .config import GITHUB_TOKEN, DEFAULT_COMMIT_ANALYSIS_DAYS, DEFAULT_TOP_REPOS_LIMIT
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .config import GITHUB_TOKEN, GITHUB_PER_PAGE, DEFAULT_COMMIT_ANALYSIS_DAYS, DEFAULT_TOP_REPOS_LIMIT
+
+
+def _dumps_json(obj, default) -> str:
+    """
+    Serialize data to indented JSON text, using orjson when it is installed.
+    
+    orjson writes datetimes in isoformat() natively, matching the stdlib handler output.
+    
+    Args:
+        obj: Data to serialize
+        default: Fallback serializer for unsupported types
+        
+    Returns:
+        str: JSON text
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(obj, default=default, option=option).decode('utf-8')
+    return json.dumps(obj, indent=2, default=default, ensure_ascii=False)
 
 
 class AdvancedGitHubMiner:
@@ -35,7 +61,9 @@ class AdvancedGitHubMiner:
         self.stop_event = stop_event
         
         try:
-            self.github = Github(github_token)
+            # Page size set once here, at GitHub's maximum: full listings (repos, commits) take the fewest
+            # round-trips, and listings sliced to 100 items or fewer fit in a single page
+            self.github = Github(github_token, per_page=GITHUB_PER_PAGE)
             # Test the token by getting user info
             self.github.get_user().login
         except GithubException as e:
@@ -129,7 +157,8 @@ class AdvancedGitHubMiner:
         
         try:
             user = self.github.get_user(username)
-            repos = list(user.get_repos())
+            # Only the 10 most recently pushed repos are analyzed, so stop paginating after them
+            repos = list(itertools.islice(user.get_repos(sort='pushed', direction='desc'), 10))
             
             patterns = {
                 'commit_frequency': [],
@@ -143,7 +172,7 @@ class AdvancedGitHubMiner:
             }
             
             # Process user's repositories (limit to first 10 for performance)
-            for repo in repos[:10]:
+            for repo in repos:
                 if self.stop_event and self.stop_event.is_set():
                     break
                     
@@ -756,7 +785,7 @@ class AdvancedGitHubMiner:
                                 
                                 # Only store recent commit details and limit to 50
                                 if len(activity_data['recent_commits']) < 50:
-                                    day_key = commit_date.strftime('%Y-%m-%d')
+                                    day_key = commit_date.isoformat()[:10]  # same as strftime('%Y-%m-%d'), without format parsing
                                     hour_key = str(commit_date.hour)
                                     
                                     activity_data['active_days'].add(day_key)
@@ -880,7 +909,7 @@ class AdvancedGitHubMiner:
             # Create new file with opening bracket
             with open(json_filename, 'w', encoding='utf-8') as f:
                 f.write('[\n')
-                json.dump(user_data, f, indent=2, default=datetime_handler, ensure_ascii=False)
+                f.write(_dumps_json(user_data, datetime_handler))
                 f.write('\n]')
         else:
             # Read existing file and append new data
@@ -898,12 +927,12 @@ class AdvancedGitHubMiner:
                         # Position before the closing bracket
                         f.seek(file_size - 2)
                         f.write(',\n')
-                        json.dump(user_data, f, indent=2, default=datetime_handler, ensure_ascii=False)
+                        f.write(_dumps_json(user_data, datetime_handler))
                         f.write('\n]')
                     else:
                         # File might be corrupted, append safely
                         f.write(',\n')
-                        json.dump(user_data, f, indent=2, default=datetime_handler, ensure_ascii=False)
+                        f.write(_dumps_json(user_data, datetime_handler))
                         f.write('\n]')
     
     def _append_to_csv_file(self, flattened_data: Dict, csv_filename: str):
@@ -916,17 +945,17 @@ class AdvancedGitHubMiner:
         """
         import os
         
-        df = pd.DataFrame([flattened_data])
-        
         # Check if file exists
         file_exists = os.path.exists(csv_filename)
         
-        if not file_exists:
-            # Create new file with headers
-            df.to_csv(csv_filename, index=False, encoding='utf-8')
-        else:
-            # Append without headers
-            df.to_csv(csv_filename, mode='a', header=False, index=False, encoding='utf-8')
+        # A single row does not need a DataFrame; write it with csv directly
+        # (same quoting and line endings as DataFrame.to_csv)
+        with open(csv_filename, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator=os.linesep)
+            if not file_exists:
+                # Create new file with headers
+                writer.writerow(flattened_data.keys())
+            writer.writerow(flattened_data.values())
     
     def export_for_machine_learning(self, dataset: List[Dict], filename: str):
         """
@@ -950,7 +979,7 @@ class AdvancedGitHubMiner:
                 raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
             
             with open(json_filename, 'w', encoding='utf-8') as f:
-                json.dump(dataset, f, indent=2, default=datetime_handler, ensure_ascii=False)
+                f.write(_dumps_json(dataset, datetime_handler))
             
             # Flatten data for CSV export
             flattened_data = []
@@ -1433,7 +1462,10 @@ class AdvancedGitHubMiner:
         
         try:
             user = self.github.get_user(username)
-            repos = list(user.get_repos())
+            # Only the first 10 repos are inspected; islice stops PyGithub from paging through the rest
+            repos = list(itertools.islice(user.get_repos(), 10))
+            # get_repos() lists the user's public owned repos, which public_repos already counts
+            repo_count = user.public_repos
             
             quality_data = {
                 'commit_message_analysis': {},
@@ -1452,7 +1484,7 @@ class AdvancedGitHubMiner:
             test_contributions = 0
             ci_files = 0
             
-            for repo in repos[:10]:  # Limit to avoid rate limits
+            for repo in repos:  # Limit to avoid rate limits
                 try:
                     if repo.fork:
                         continue
@@ -1553,17 +1585,17 @@ class AdvancedGitHubMiner:
             # Documentation and testing
             quality_data['documentation_contributions'] = {
                 'doc_files_count': doc_contributions,
-                'documentation_ratio': doc_contributions / len(repos) if repos else 0
+                'documentation_ratio': doc_contributions / repo_count if repo_count else 0
             }
             
             quality_data['testing_patterns'] = {
                 'test_files_count': test_contributions,
-                'testing_ratio': test_contributions / len(repos) if repos else 0
+                'testing_ratio': test_contributions / repo_count if repo_count else 0
             }
             
             quality_data['ci_cd_adoption'] = {
                 'ci_files_count': ci_files,
-                'ci_adoption_ratio': ci_files / len(repos) if repos else 0
+                'ci_adoption_ratio': ci_files / repo_count if repo_count else 0
             }
             
             return quality_data
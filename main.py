@@ -1,34 +1,666 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import re
-from github import Github, GithubException
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from github import Github, GithubException, RateLimitExceededException
+from github.Repository import Repository
+from github.NamedUser import NamedUser
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 import time
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import logging
 import numpy as np
 import tkinter as tk
 from tkinter import messagebox, ttk, filedialog
 import threading
+import queue
 import argparse
 import sys
 import os
+import functools
+import contextlib
+import itertools
+import random
+import heapq
+import sqlite3
+import hashlib
+import weakref
+import pickle
+import multiprocessing
+import gzip
+import uuid
+from collections import Counter, OrderedDict
+from operator import attrgetter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-# Global GitHub token (can be set via GUI or environment variable)
+# Default GitHub token for the CLI helpers; the GUI keeps its own copy in GitHubMinerGUI.token
 GITHUB_TOKEN = ""
 
+# orjson options matching the stdlib datetime_handler output ('%Y-%m-%dT%H:%M:%SZ')
+ORJSON_DUMP_OPTIONS = (orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS |
+                       orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_OMIT_MICROSECONDS) if orjson else 0
+# Same, but one compact record per line for the JSON Lines raw-data file
+ORJSON_JSONL_OPTIONS = ((ORJSON_DUMP_OPTIONS & ~orjson.OPT_INDENT_2) | orjson.OPT_APPEND_NEWLINE) if orjson else 0
+
+# Retry policy for GitHub API calls (rate limits and transient server errors)
+GITHUB_RETRY_ATTEMPTS = 5
+GITHUB_RETRY_MAX_BACKOFF = 60  # seconds
+# Below this many core requests left, calls wait for the reset instead of running into 403s
+GITHUB_RATE_LIMIT_RESERVE = 50
+# API calls in flight at once across all threads of a miner; nested user/analyzer/repo pools
+# would otherwise burst into GitHub's secondary (concurrency) rate limit
+GITHUB_MAX_CONCURRENT_CALLS = 10
+# Upper bound on the pause between discovery mining batches
+BATCH_PAUSE_MAX = 60  # seconds
+# Rate-limit resources a TokenPool balances, and how often it re-reads them from GitHub
+TOKEN_POOL_RESOURCES = ('core', 'search')
+TOKEN_BUDGET_REFRESH = 15  # seconds
+
+# GitHub's maximum page size; fewer round-trips per paginated listing
+GITHUB_PER_PAGE = 100
+GITHUB_FETCH_WORKERS = 8
+# Analyzers run at once for one user; kept low to stay clear of GitHub's secondary rate limits
+USER_ANALYZER_WORKERS = 4
+# Keep-alive pool large enough for parallel users x per-repo fetch threads
+GITHUB_POOL_SIZE = 50
+
+# How often the GUI thread drains queued status messages (caps log repaints at 10 Hz)
+STATUS_POLL_MS = 100
+# Messages inserted per drain, and lines kept in the status log
+STATUS_DRAIN_BATCH = 500
+STATUS_MAX_LINES = 5000
+
+# Conditional-request cache; 304 responses are served from here and do not count against the rate limit
+ETAG_CACHE_FILE = "github_etag_cache.sqlite"
+# Within these ages a cached response is reused without asking GitHub at all (seconds)
+USER_CACHE_TTL = 60 * 60
+REPO_CACHE_TTL = 30 * 60
+# Analyzer results kept in memory at most (7 analyzers per user); least recently used go first
+USER_CACHE_MAX_ENTRIES = 7 * 100
+# Below this many users, process start-up costs more than it saves
+ML_FEATURE_PROCESS_THRESHOLD = 1000
+ML_FEATURE_MIN_CHUNKSIZE = 16
+# Explicit dtypes for the fixed feature columns so Parquet files keep a stable schema across appends
+ML_INT_FEATURES = ['followers', 'following', 'public_repos', 'account_age_days', 'public_gists',
+                   'starred_repo_count', 'watched_repo_count', 'gist_count', 'organization_count', 'event_count',
+                   'total_commits', 'max_productivity_streak', 'total_active_days', 'languages_used',
+                   'commit_comments_count', 'issue_comments_count', 'pr_reviews_count',
+                   'total_repos_analyzed', 'total_contributors']
+ML_FLOAT_FEATURES = ['avg_commits_per_repo', 'avg_repo_stars', 'avg_repo_forks', 'avg_repo_size',
+                     'avg_branches', 'avg_releases', 'avg_tags', 'avg_issues', 'avg_resolution_time',
+                     'avg_lines_of_code', 'avg_comment_ratio', 'avg_function_count', 'avg_class_count', 'avg_file_count']
+# Records converted per batch when streaming JSONL to CSV
+CSV_STREAM_BATCH_SIZE = 10_000
+# Buffer size for dataset reads/writes; json.dump and to_csv issue many small writes
+IO_BUFFER_SIZE = 64 * 1024
+# Raw mined records are appended here, one JSON object per line
+RAW_DATA_FILE = "github_data_raw.jsonl"
+# Earlier single-array file; its records are carried over the first time RAW_DATA_FILE is created
+LEGACY_RAW_DATA_FILE = "github_data_raw.json"
+# Each export adds one zstd Parquet part file here; existing parts are never rewritten
+PARQUET_DATASET_DIR = "github_data_ml_features_parquet"
+
+# Shared keep-alive pool for direct HTTP calls (GraphQL, gharchive); PyGithub keeps its own
+HTTP_POOL_SIZE = 32
+HTTP_RETRY = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504],
+                   allowed_methods=frozenset({'GET', 'POST'}), raise_on_status=False)
+GHARCHIVE_TIMEOUT = 30  # seconds
+# Hourly archives downloaded at once; decoding holds the GIL, so more threads mostly add memory
+GHARCHIVE_FETCH_WORKERS = 16
+# Leading bytes of an archive line searched for the event type before parsing the whole line
+GHARCHIVE_TYPE_SCAN_BYTES = 96
+
+# One GraphQL query replaces the per-repo REST calls in analyze_development_patterns
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+GITHUB_GRAPHQL_TIMEOUT = 60  # seconds
+# Aliased user(login:) lookups per GraphQL request when filtering discovered users by location
+USER_LOCATION_BATCH_SIZE = 50
+DEVELOPMENT_PATTERNS_QUERY = """
+query($login: String!, $authorId: ID!) {
+  user(login: $login) {
+    repositories(first: 10, ownerAffiliations: OWNER, isFork: false, orderBy: {field: PUSHED_AT, direction: DESC}) {
+      nodes {
+        name
+        createdAt
+        languages(first: 20) { edges { size node { name } } }
+        defaultBranchRef { target { ... on Commit {
+          history(first: 100, author: {id: $authorId}) {
+            pageInfo { hasNextPage endCursor }
+            nodes { oid authoredDate comments(first: 30) { nodes { author { login } body createdAt } } }
+          }
+        } } }
+        issues(first: 50, filterBy: {createdBy: $login}, orderBy: {field: CREATED_AT, direction: DESC}) {
+          nodes { number comments(first: 30) { nodes { author { login } body createdAt } } }
+        }
+        pullRequests(first: 50, orderBy: {field: CREATED_AT, direction: DESC}) {
+          nodes { number reviews(first: 30) { nodes { author { login } state body submittedAt } } }
+        }
+      }
+    }
+  }
+}
+"""
+# Profile fields and the starred/watched/gist/org listings of collect_extended_user_data
+EXTENDED_USER_QUERY = """
+query($login: String!) {
+  user(login: $login) {
+    email location bio company websiteUrl twitterUsername isHireable avatarUrl
+    publicGists: gists(privacy: PUBLIC) { totalCount }
+    recentGists: gists(first: 10, privacy: PUBLIC, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes { name description createdAt }
+    }
+    starredRepositories(first: 10, orderBy: {field: STARRED_AT, direction: DESC}) { nodes { nameWithOwner stargazerCount } }
+    watching(first: 10) { nodes { nameWithOwner stargazerCount } }
+    organizations(first: 100) { nodes { login description } }
+  }
+}
+"""
+# Languages and topics of all of a user's own repositories, 100 per request, for the repo-level analyzers
+REPO_DETAILS_QUERY = """
+query($login: String!, $cursor: String) {
+  user(login: $login) {
+    repositories(first: 100, after: $cursor, ownerAffiliations: OWNER, isFork: false) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        nameWithOwner
+        languages(first: 100) { edges { size node { name } } }
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+      }
+    }
+  }
+}
+"""
+# Follow-up pages of a repo's commit history once the first 100 commits are exhausted
+COMMIT_HISTORY_QUERY = """
+query($owner: String!, $name: String!, $authorId: ID!, $cursor: String!) {
+  repository(owner: $owner, name: $name) {
+    defaultBranchRef { target { ... on Commit {
+      history(first: 100, after: $cursor, author: {id: $authorId}) {
+        pageInfo { hasNextPage endCursor }
+        nodes { oid authoredDate }
+      }
+    } } }
+  }
+}
+"""
+# A repo's commits by one author since a date, with line stats inline instead of a REST call per commit
+RECENT_COMMITS_QUERY = """
+query($owner: String!, $name: String!, $authorId: ID!, $since: GitTimestamp!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    defaultBranchRef { target { ... on Commit {
+      history(first: 100, after: $cursor, author: {id: $authorId}, since: $since) {
+        pageInfo { hasNextPage endCursor }
+        nodes { oid authoredDate message additions deletions }
+      }
+    } } }
+  }
+}
+"""
+
+# (stars above, original repos above, level), checked in order; anything below is 'Beginner'
+CONTRIBUTION_LEVELS = [(1000, 50, 'High'), (100, 20, 'Medium'), (10, 5, 'Low')]
+
+TECH_KEYWORDS = ['api', 'web', 'mobile', 'data', 'machine', 'learning', 'ai', 'cloud', 'database', 'frontend', 'backend', 'devops', 'security', 'blockchain', 'iot', 'game', 'bot', 'cli', 'library', 'framework', 'tool', 'automation', 'testing', 'monitoring']
+# One precompiled pass over each description; keywords of two letters or fewer are ignored
+TECH_KEYWORD_PATTERN = re.compile(r'\b(' + '|'.join(re.escape(kw) for kw in TECH_KEYWORDS if len(kw) > 2) + r')\b')
+
+# Hourly gharchive file for (YYYY-MM-DD, hour); date_range values must be plain ISO dates
+GHARCHIVE_URL_TEMPLATE = "https://data.gharchive.org/{}-{}.json.gz"
+ISO_DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}$')
+
+# Compiled once; used to pull owner/repo and usernames out of pasted GitHub URLs
+GITHUB_REPO_URL_PATTERN = re.compile(r'github\.com/([^/]+)/([^/]+)')
+GITHUB_USERNAME_PATTERN = re.compile(r'github\.com/([a-zA-Z0-9-]+)')
+
+
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE,
+                                       max_retries=HTTP_RETRY))
+
+
+def get_session() -> requests.Session:
+    """Return the shared HTTP session, e.g. to mount a different retry adapter."""
+    return _SESSION
+
+
+def _parse_github_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse a GraphQL DateTime string into an aware datetime, like PyGithub returns."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00')) if value else None
+
+
+@functools.lru_cache(maxsize=128)
+def _build_user_search_query(criteria_items: tuple) -> str:
+    """Build a user search query from sorted (key, value) criteria pairs; repeated criteria reuse the string."""
+    criteria = dict(criteria_items)
+    query_parts = []
+    
+    # Build search query
+    if criteria.get('language'):
+        query_parts.append(f"language:{criteria['language']}")
+    
+    if criteria.get('location'):
+        query_parts.append(f"location:{criteria['location']}")
+    
+    if criteria.get('min_followers'):
+        query_parts.append(f"followers:>={criteria['min_followers']}")
+    
+    if criteria.get('min_repos'):
+        query_parts.append(f"repos:>={criteria['min_repos']}")
+    
+    if criteria.get('company'):
+        query_parts.append(f"company:{criteria['company']}")
+    
+    # Add type:user to search for users specifically
+    query_parts.append("type:user")
+    
+    return " ".join(query_parts)
+
+
+def _load_json_file(path: str):
+    """Parse a JSON file, using orjson's faster parser when it is installed."""
+    # One unbuffered read of the whole file; FileIO.readall sizes it from fstat
+    with open(path, 'rb', buffering=0) as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _is_jsonl(path: str) -> bool:
+    """Return True if the file holds newline-delimited JSON records rather than a JSON array."""
+    with open(path, 'rb') as f:
+        while chunk := f.read(4096):
+            stripped = chunk.lstrip()
+            if stripped:
+                return stripped[:1] == b'{'
+    return False
+
+
+def _iter_jsonl(path: str):
+    """Yield the record on each non-blank line of a JSONL file."""
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+def _account_age_days(created_at_values: List) -> np.ndarray:
+    """Vectorized account age in days; missing or unparseable dates count as 0."""
+    created_at = pd.to_datetime(pd.Series(created_at_values, dtype=object), utc=True, errors='coerce', format='mixed')
+    account_age = pd.Timestamp.now() - created_at.dt.tz_localize(None)
+    return account_age.dt.days.fillna(0).astype(int).to_numpy()
+
+
+def _stringify_nested_cells(df: pd.DataFrame) -> None:
+    """str() the dict and list cells of a feature frame in place so they fit in one CSV cell.
+    
+    infer_dtype scans each column in C; only columns it reports as mixed can hold dicts or lists.
+    """
+    for col in df.columns[df.dtypes == object]:
+        if not pd.api.types.infer_dtype(df[col], skipna=True).startswith('mixed'):
+            continue
+        nested = df[col].map(lambda x: isinstance(x, (dict, list)))
+        if nested.any():
+            df.loc[nested, col] = df.loc[nested, col].map(str)
+
+
+def _with_feature_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast the known count and average feature columns to nullable numeric dtypes."""
+    dtypes = {col: 'Int64' for col in ML_INT_FEATURES if col in df.columns}
+    dtypes.update({col: 'Float64' for col in ML_FLOAT_FEATURES if col in df.columns})
+    return df.astype(dtypes)
+
+
+def _is_rate_limit_error(e: GithubException) -> bool:
+    """Return True if the exception is a primary or secondary rate-limit response."""
+    if isinstance(e, RateLimitExceededException) or e.status == 429:
+        return True
+    return e.status == 403 and 'rate limit' in str(e).lower()
+
+
+def _wait_for_rate_limit_reserve(miner) -> None:
+    """Sleep until the rate limit resets if fewer than GITHUB_RATE_LIMIT_RESERVE core requests remain.
+    
+    Uses the counters PyGithub keeps from the last response, so no extra request is made.
+    """
+    remaining, _ = miner.github.rate_limiting
+    delay = miner.github.rate_limiting_resettime - time.time() + 1
+    if remaining >= GITHUB_RATE_LIMIT_RESERVE or delay <= 0:
+        return
+    logging.warning(f"Only {remaining} GitHub API requests left, pausing {delay:.0f}s until the rate limit resets")
+    if miner.stop_event:
+        miner.stop_event.wait(delay)
+    else:
+        time.sleep(delay)
+
+
+def _batch_pause(miner, requests_used: int) -> float:
+    """Seconds to pause after a mining batch that spent ``requests_used`` core requests.
+    
+    Spreads the remaining quota evenly over the rest of the rate-limit window, assuming the
+    next batch costs about as much as the last one. A heuristic, capped at BATCH_PAUSE_MAX.
+    """
+    remaining, reset_epoch = miner.last_rate_limit
+    per_request = max(0.0, reset_epoch - time.time()) / max(remaining, 1)
+    return min(per_request * max(requests_used, 0), BATCH_PAUSE_MAX)
+
+
+@contextlib.contextmanager
+def _api_call_slot(miner):
+    """Hold one of the miner's GITHUB_MAX_CONCURRENT_CALLS slots; nested calls on a thread reuse its slot."""
+    if getattr(miner._api_local, 'holds_slot', False):
+        yield
+        return
+    with miner._api_semaphore:
+        miner._api_local.holds_slot = True
+        try:
+            yield
+        finally:
+            miner._api_local.holds_slot = False
+
+
+def github_retry(func):
+    """Retry a GitHub API call, sleeping until the rate limit resets when it is hit.
+    
+    Calls pause first when the remaining budget is below GITHUB_RATE_LIMIT_RESERVE, and at
+    most GITHUB_MAX_CONCURRENT_CALLS run at once (backoff sleeps do not hold a slot).
+    Rate-limit responses wait for ``Retry-After``/``X-RateLimit-Reset``; 5xx responses
+    back off exponentially with jitter. Other errors are raised immediately.
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        _wait_for_rate_limit_reserve(self)
+        for attempt in range(1, GITHUB_RETRY_ATTEMPTS + 1):
+            try:
+                with _api_call_slot(self):
+                    return func(self, *args, **kwargs)
+            except GithubException as e:
+                rate_limited = _is_rate_limit_error(e)
+                if attempt == GITHUB_RETRY_ATTEMPTS or not (rate_limited or (e.status or 0) >= 500):
+                    raise
+                
+                headers = e.headers or {}
+                if rate_limited and headers.get('retry-after'):
+                    delay = float(headers['retry-after'])
+                elif rate_limited:
+                    reset = int(headers.get('x-ratelimit-reset') or self.github.rate_limiting_resettime or 0)
+                    delay = max(reset - time.time(), 0) + 1
+                else:
+                    delay = min(2 ** attempt, GITHUB_RETRY_MAX_BACKOFF) + random.uniform(0, 1)
+                
+                logging.warning(f"GitHub API error {e.status} in {func.__name__}, retrying in {delay:.0f}s "
+                                f"(attempt {attempt}/{GITHUB_RETRY_ATTEMPTS})")
+                if self.stop_event:
+                    if self.stop_event.wait(delay):
+                        raise
+                else:
+                    time.sleep(delay)
+    return wrapper
+
+
+def cached_per_user(func):
+    """Memoize an analyzer's result per username and arguments for USER_CACHE_TTL seconds.
+    
+    Empty results (what analyzers return on API errors) and results of a stopped run are
+    not cached, so the next call fetches again. Expired entries are dropped on insert and
+    at most USER_CACHE_MAX_ENTRIES are kept, evicting the least recently used.
+    """
+    @functools.wraps(func)
+    def wrapper(self, username, *args, **kwargs):
+        key = (func.__name__, username, args, tuple(sorted(kwargs.items())))
+        with self._user_cache_lock:
+            cached = self._user_cache.get(key)
+            if cached and time.time() - cached[0] < USER_CACHE_TTL:
+                self._user_cache.move_to_end(key)
+                return cached[1]
+        result = func(self, username, *args, **kwargs)
+        if result and not (self.stop_event and self.stop_event.is_set()):
+            now = time.time()
+            with self._user_cache_lock:
+                self._user_cache[key] = (now, result)
+                self._user_cache.move_to_end(key)
+                expired = [k for k, (stored_at, _) in self._user_cache.items() if now - stored_at >= USER_CACHE_TTL]
+                for k in expired:
+                    del self._user_cache[k]
+                while len(self._user_cache) > USER_CACHE_MAX_ENTRIES:
+                    self._user_cache.popitem(last=False)
+        return result
+    return wrapper
+
+
+def extract_ml_features(user_data: Dict, mined_date: str) -> Dict:
+    """Flatten one user's mined data into a row of ML features.
+    
+    Kept at module level (and free of miner state) so it can run in worker processes.
+    """
+    # Basic user features
+    features = {
+        'username': user_data.get('username'),
+        'name': user_data.get('name'),
+        'followers': user_data.get('followers', 0),
+        'following': user_data.get('following', 0),
+        'public_repos': user_data.get('public_repos', 0),
+        'account_age_days': 0,  # Initialize with 0
+        'mined_date': mined_date
+    }
+    
+    # Extended user data
+    extended_data = user_data.get('extended_user_data', {})
+    features.update({
+        'email': extended_data.get('email'),
+        'location': extended_data.get('location'),
+        'bio': extended_data.get('bio'),
+        'company': extended_data.get('company'),
+        'blog': extended_data.get('blog'),
+        'twitter_username': extended_data.get('twitter_username'),
+        'hireable': extended_data.get('hireable'),
+        'public_gists': extended_data.get('public_gists', 0),
+        'avatar_url': extended_data.get('avatar_url'),
+        'starred_repo_count': len(extended_data.get('starred_repos', [])),
+        'watched_repo_count': len(extended_data.get('watched_repos', [])),
+        'gist_count': len(extended_data.get('gists', [])),
+        'organization_count': len(extended_data.get('organizations', [])),
+        'event_count': len(extended_data.get('events', []))
+    })
+    
+    # Development patterns
+    patterns = user_data.get('development_patterns', {})
+    if patterns:
+        lifecycle = patterns.get('repository_lifecycle', [])
+        features.update({
+            'total_commits': len(patterns.get('commit_frequency', [])),
+            'avg_commits_per_repo': sum(r.get('total_commits', 0) for r in lifecycle) / len(lifecycle) if lifecycle else 0,
+            'max_productivity_streak': patterns.get('productivity_streaks', {}).get('max_streak', 0),
+            'total_active_days': patterns.get('productivity_streaks', {}).get('total_active_days', 0),
+            'languages_used': len(patterns.get('language_evolution', {})),
+            'commit_comments_count': len(patterns.get('commit_comments', [])),
+            'issue_comments_count': len(patterns.get('issue_comments', [])),
+            'pr_reviews_count': len(patterns.get('pr_reviews', []))
+        })
+    
+        # Add language evolution data
+        for lang, data in patterns.get('language_evolution', {}).items():
+            features[f'language_{lang}_bytes'] = sum(item.get('bytes', 0) for item in data)
+            features[f'language_{lang}_repos'] = len(data)
+    
+    # Repository data
+    repos = user_data.get('repositories', [])
+    if repos:
+        # Walk each repository once, accumulating running totals for the averages alongside the
+        # per-repo columns; a handful of repos is far too few for NumPy reductions to pay off.
+        stars = forks = sizes = contributors = issue_counts = branches = releases = tags = 0
+        resolution_total, resolution_count = 0, 0
+        complexity_totals = [0, 0, 0, 0, 0]
+        repo_features = {}
+        for i, repo in enumerate(repos):
+            extended_repo = repo.get('extended_repo_data', {})
+            issues = repo.get('issues', [])
+            repo_stars = repo.get('stars', 0)
+            repo_forks = repo.get('forks', 0)
+            repo_size = repo.get('size', 0)
+            repo_contributors = len(repo.get('contributor_network', {}).get('contributors', []))
+            repo_branches = len(extended_repo.get('branches', []))
+            repo_releases = len(extended_repo.get('releases', []))
+            repo_tags = len(extended_repo.get('tags', []))
+            
+            stars += repo_stars
+            forks += repo_forks
+            sizes += repo_size
+            contributors += repo_contributors
+            issue_counts += len(issues)
+            branches += repo_branches
+            releases += repo_releases
+            tags += repo_tags
+            for issue in issues:
+                resolution_time = issue.get('resolution_time_hours')
+                if resolution_time:
+                    resolution_total += resolution_time
+                    resolution_count += 1
+            
+            complexity = repo.get('complexity', {})
+            if complexity:
+                complexity_totals[0] += complexity.get('lines_of_code', 0)
+                complexity_totals[1] += complexity.get('comment_ratio', 0)
+                complexity_totals[2] += complexity.get('function_count', 0)
+                complexity_totals[3] += complexity.get('class_count', 0)
+                complexity_totals[4] += complexity.get('file_count', 0)
+            
+            # Assign straight into repo_features (kept apart so these columns still follow the aggregates)
+            prefix = f"{repo.get('name', f'repo_{i}')}_"
+            repo_features[prefix + 'stars'] = repo_stars
+            repo_features[prefix + 'forks'] = repo_forks
+            repo_features[prefix + 'size'] = repo_size
+            repo_features[prefix + 'language'] = repo.get('language')
+            repo_features[prefix + 'contributors'] = repo_contributors
+            repo_features[prefix + 'issues'] = len(issues)
+            repo_features[prefix + 'branches'] = repo_branches
+            repo_features[prefix + 'releases'] = repo_releases
+            repo_features[prefix + 'tags'] = repo_tags
+        
+        repo_count = len(repos)
+        features.update({
+            'total_repos_analyzed': repo_count,
+            'avg_repo_stars': stars / repo_count,
+            'avg_repo_forks': forks / repo_count,
+            'avg_repo_size': sizes / repo_count,
+            'total_contributors': contributors,
+            'avg_branches': branches / repo_count,
+            'avg_releases': releases / repo_count,
+            'avg_tags': tags / repo_count,
+            'avg_issues': issue_counts / repo_count,
+            'avg_resolution_time': resolution_total / resolution_count if resolution_count else np.nan
+        })
+        
+        # Add repository complexity metrics
+        features.update({
+            'avg_lines_of_code': complexity_totals[0] / repo_count,
+            'avg_comment_ratio': complexity_totals[1] / repo_count,
+            'avg_function_count': complexity_totals[2] / repo_count,
+            'avg_class_count': complexity_totals[3] / repo_count,
+            'avg_file_count': complexity_totals[4] / repo_count
+        })
+        
+        # Add repository-specific data
+        features.update(repo_features)
+    
+    return features
+
+
+class TokenPool:
+    """GitHub clients for several tokens; each call goes to the one with the most rate limit left.
+    
+    Core and search requests have separate budgets, so they are tracked per resource from
+    GET /rate_limit (which does not count against either) rather than from PyGithub's
+    ``rate_limiting``, which reflects whichever resource the last response belonged to.
+    """
+    
+    def __init__(self, tokens: List[str]):
+        if not tokens:
+            raise ValueError("GitHub token is required")
+        self.clients = [Github(token, per_page=GITHUB_PER_PAGE) for token in tokens]
+        self._lock = threading.Lock()
+        # Per client: {resource: [remaining, reset epoch]}, and when it was last read from GitHub
+        self._budgets = [{} for _ in self.clients]
+        self._checked_at = [0.0] * len(self.clients)
+    
+    def __len__(self) -> int:
+        return len(self.clients)
+    
+    def _refresh(self, index: int, now: float) -> None:
+        """Read a client's core and search budgets from GET /rate_limit."""
+        try:
+            resources = self.clients[index].get_rate_limit().resources
+            self._budgets[index] = {name: [getattr(resources, name).remaining, getattr(resources, name).reset.timestamp()]
+                                    for name in TOKEN_POOL_RESOURCES}
+        except GithubException as e:
+            # An unusable token is skipped until the next refresh
+            logging.warning(f"Could not read rate limits for pooled token {index + 1}: {e}")
+            self._budgets[index] = {name: [0, now + TOKEN_BUDGET_REFRESH] for name in TOKEN_POOL_RESOURCES}
+        self._checked_at[index] = now
+    
+    def _remaining(self, index: int, resource: str, now: float) -> int:
+        """Requests left for a client's resource, re-read when stale or once an exhausted window has reset."""
+        if now - self._checked_at[index] >= TOKEN_BUDGET_REFRESH:
+            self._refresh(index, now)
+        remaining, reset_epoch = self._budgets[index][resource]
+        if remaining <= 0 and reset_epoch <= now:
+            self._refresh(index, now)
+            remaining = self._budgets[index][resource][0]
+        return remaining
+    
+    def acquire(self, resource: str = 'core') -> Github:
+        """Return the client with the most ``resource`` requests remaining, waiting for a reset if all are exhausted."""
+        while True:
+            with self._lock:
+                now = time.time()
+                index = max(range(len(self.clients)), key=lambda i: self._remaining(i, resource, now))
+                if self._remaining(index, resource, now) > 0:
+                    # Counted locally until the next refresh corrects it
+                    self._budgets[index][resource][0] -= 1
+                    return self.clients[index]
+                delay = min(budget[resource][1] for budget in self._budgets) - now + 1
+            logging.warning(f"All {len(self.clients)} GitHub tokens are out of {resource} requests, waiting {delay:.0f}s")
+            time.sleep(max(delay, 1))
+
+
 class AutoProfileDiscovery:
-    def __init__(self, github_token: str = None):
-        self.token = github_token or GITHUB_TOKEN
-        if not self.token:
+    def __init__(self, github_token=None):
+        """Accepts one token, a comma-separated string of tokens, or a list of tokens."""
+        tokens = github_token or GITHUB_TOKEN
+        if isinstance(tokens, str):
+            tokens = [token.strip() for token in tokens.split(',') if token.strip()]
+        if not tokens:
             raise ValueError("GitHub token is required")
-        self.github = Github(self.token)
+        self.token = tokens[0]
+        self.token_pool = TokenPool(tokens)
         self.headers = {'Authorization': f'token {self.token}'}
+        # login -> profile location; the same people recur across discovery methods
+        self._location_cache = {}
+    
+    @property
+    def github(self) -> Github:
+        """The pooled client with the most rate limit left; objects it returns keep using that token."""
+        return self.token_pool.acquire()
+    
+    @property
+    def search_github(self) -> Github:
+        """The pooled client with the most search rate limit left, for search_* calls."""
+        return self.token_pool.acquire('search')
     
     def discover_trending_developers(self, language: str = None, location: str = None, limit: int = 50):
         """Discover developers from trending repositories."""
@@ -49,8 +681,10 @@ class AutoProfileDiscovery:
             print(f"Searching trending repositories with query: {query}")
             
             # Get trending repositories
-            repos = self.github.search_repositories(query, sort="stars", order="desc")
+            repos = self.search_github.search_repositories(query, sort="stars", order="desc")
             
+            # With a location filter, candidates are collected first and their locations looked up in batches
+            candidates = []
             processed_repos = 0
             for repo in repos:
                 if len(discovered_users) >= limit:
@@ -60,27 +694,20 @@ class AutoProfileDiscovery:
                     # Get repository owner
                     if repo.owner and repo.owner.type == "User":
                         if location:
-                            user = self.github.get_user(repo.owner.login)
-                            if user.location and location.lower() in user.location.lower():
-                                discovered_users.add(repo.owner.login)
+                            candidates.append(repo.owner.login)
                         else:
                             discovered_users.add(repo.owner.login)
                     
                     # Get top contributors
                     try:
                         contributors = repo.get_contributors()
-                        for contributor in list(contributors)[:5]:  # Top 5 contributors
+                        for contributor in itertools.islice(contributors, 5):  # Top 5 contributors
                             if len(discovered_users) >= limit:
                                 break
                             
                             if contributor.type == "User":
                                 if location:
-                                    try:
-                                        user = self.github.get_user(contributor.login)
-                                        if user.location and location.lower() in user.location.lower():
-                                            discovered_users.add(contributor.login)
-                                    except:
-                                        pass
+                                    candidates.append(contributor.login)
                                 else:
                                     discovered_users.add(contributor.login)
                     except:
@@ -94,6 +721,16 @@ class AutoProfileDiscovery:
                     print(f"Error processing repo {repo.full_name}: {e}")
                     continue
             
+            if location:
+                candidates = list(dict.fromkeys(candidates))
+                user_locations = self._get_user_locations(candidates)
+                for login in candidates:
+                    if len(discovered_users) >= limit:
+                        break
+                    user_location = user_locations.get(login)
+                    if user_location and location.lower() in user_location.lower():
+                        discovered_users.add(login)
+            
             print(f"Discovered {len(discovered_users)} developers from trending repositories")
             return list(discovered_users)[:limit]
             
@@ -101,39 +738,41 @@ class AutoProfileDiscovery:
             print(f"Error discovering trending developers: {e}")
             return []
     
+    def _get_user_locations(self, logins: List[str]) -> Dict[str, Optional[str]]:
+        """Look up profile locations with aliased GraphQL user queries, a batch of logins per request."""
+        locations = self._location_cache
+        missing = [login for login in logins if login not in locations]
+        for start in range(0, len(missing), USER_LOCATION_BATCH_SIZE):
+            batch = missing[start:start + USER_LOCATION_BATCH_SIZE]
+            declarations = ', '.join(f'$l{i}: String!' for i in range(len(batch)))
+            fields = ' '.join(f'u{i}: user(login: $l{i}) {{ login location }}' for i in range(len(batch)))
+            try:
+                response = _SESSION.post(GITHUB_GRAPHQL_URL,
+                                         json={'query': f'query({declarations}) {{ {fields} }}',
+                                               'variables': {f'l{i}': login for i, login in enumerate(batch)}},
+                                         headers=self.headers, timeout=GITHUB_GRAPHQL_TIMEOUT)
+                response.raise_for_status()
+                # Logins that no longer resolve come back as null aliases
+                data = response.json().get('data') or {}
+            except (requests.RequestException, ValueError) as e:
+                print(f"Error looking up user locations: {e}")
+                continue
+            for i, login in enumerate(batch):
+                user = data.get(f'u{i}')
+                locations[login] = user.get('location') if user else None
+        return {login: locations[login] for login in logins if login in locations}
+    
     def discover_by_search_criteria(self, criteria: dict, limit: int = 50):
         """Discover users based on search criteria."""
         try:
-            query_parts = []
-            
-            # Build search query
-            if criteria.get('language'):
-                query_parts.append(f"language:{criteria['language']}")
-            
-            if criteria.get('location'):
-                query_parts.append(f"location:{criteria['location']}")
-            
-            if criteria.get('min_followers'):
-                query_parts.append(f"followers:>={criteria['min_followers']}")
-            
-            if criteria.get('min_repos'):
-                query_parts.append(f"repos:>={criteria['min_repos']}")
-            
-            if criteria.get('company'):
-                query_parts.append(f"company:{criteria['company']}")
-            
-            # Add type:user to search for users specifically
-            query_parts.append("type:user")
-            
-            query = " ".join(query_parts)
+            query = _build_user_search_query(tuple(sorted(criteria.items())))
             print(f"Searching users with query: {query}")
             
-            users = self.github.search_users(query)
+            users = self.search_github.search_users(query)
             discovered_users = []
             
-            for user in users:
-                if len(discovered_users) >= limit:
-                    break
+            # islice stops before PyGithub requests a page past the limit
+            for user in itertools.islice(users, limit):
                 discovered_users.append(user.login)
             
             print(f"Discovered {len(discovered_users)} users from search criteria")
@@ -159,7 +798,7 @@ class AutoProfileDiscovery:
                 try:
                     # Search for repositories with specific topics
                     query = f"topic:{topic} stars:>100"
-                    repos = self.github.search_repositories(query, sort="stars", order="desc")
+                    repos = self.search_github.search_repositories(query, sort="stars", order="desc")
                     
                     processed = 0
                     for repo in repos:
@@ -173,7 +812,7 @@ class AutoProfileDiscovery:
                             
                             # Add top contributors
                             contributors = repo.get_contributors()
-                            for contributor in list(contributors)[:3]:
+                            for contributor in itertools.islice(contributors, 3):
                                 if len(discovered_users) >= limit:
                                     break
                                 if contributor.type == "User":
@@ -201,10 +840,11 @@ class AutoProfileDiscovery:
             discovered_users = set()
             
             # Search for recently updated repositories
-            recent_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
+            since = datetime.now(timezone.utc) - timedelta(days=days_back)
+            recent_date = since.strftime('%Y-%m-%d')
             
             query = f"pushed:>{recent_date} stars:>10"
-            repos = self.github.search_repositories(query, sort="updated", order="desc")
+            repos = self.search_github.search_repositories(query, sort="updated", order="desc")
             
             processed = 0
             for repo in repos:
@@ -217,8 +857,8 @@ class AutoProfileDiscovery:
                         discovered_users.add(repo.owner.login)
                     
                     # Get recent commits to find active contributors
-                    commits = repo.get_commits(since=datetime.now() - timedelta(days=days_back))
-                    for commit in list(commits)[:5]:
+                    commits = repo.get_commits(since=since)
+                    for commit in itertools.islice(commits, 5):
                         if len(discovered_users) >= limit:
                             break
                         if commit.author and commit.author.type == "User":
@@ -277,86 +917,386 @@ class AutoProfileDiscovery:
                 'days_back': 7
             }
         
-        all_discovered = set()
+        # Lowercased login -> login as GitHub returned it; logins are case-insensitive
+        all_discovered = {}
         per_method_limit = total_limit // 4  # Divide among methods
         
         try:
+            tasks = []
+            
             # Method 1: Trending developers
             if preferences.get('include_trending', True):
                 for lang in preferences.get('languages', ['python'])[:2]:
-                    trending = self.discover_trending_developers(
-                        language=lang, 
-                        limit=per_method_limit // 2
-                    )
-                    all_discovered.update(trending)
-                    if len(all_discovered) >= total_limit:
-                        break
+                    tasks.append(functools.partial(self.discover_trending_developers,
+                                                   language=lang, limit=per_method_limit // 2))
             
             # Method 2: Search-based discovery
-            if len(all_discovered) < total_limit:
-                search_criteria = {
-                    'min_followers': preferences.get('min_followers', 50),
-                    'min_repos': preferences.get('min_repos', 5)
-                }
-                
-                for lang in preferences.get('languages', ['python'])[:2]:
-                    search_criteria['language'] = lang
-                    search_users = self.discover_by_search_criteria(
-                        search_criteria, 
-                        limit=per_method_limit // 2
-                    )
-                    all_discovered.update(search_users)
-                    if len(all_discovered) >= total_limit:
-                        break
+            search_criteria = {
+                'min_followers': preferences.get('min_followers', 50),
+                'min_repos': preferences.get('min_repos', 5)
+            }
+            for lang in preferences.get('languages', ['python'])[:2]:
+                tasks.append(functools.partial(self.discover_by_search_criteria,
+                                               {**search_criteria, 'language': lang}, limit=per_method_limit // 2))
             
             # Method 3: Popular repositories
-            if len(all_discovered) < total_limit:
-                popular = self.discover_from_popular_repos(
-                    topics=preferences.get('topics'),
-                    limit=per_method_limit
-                )
-                all_discovered.update(popular)
+            tasks.append(functools.partial(self.discover_from_popular_repos,
+                                           topics=preferences.get('topics'), limit=per_method_limit))
             
             # Method 4: Recently active developers
-            if len(all_discovered) < total_limit and preferences.get('include_active', True):
-                active = self.discover_active_developers(
-                    days_back=preferences.get('days_back', 7),
-                    limit=per_method_limit
-                )
-                all_discovered.update(active)
+            if preferences.get('include_active', True):
+                tasks.append(functools.partial(self.discover_active_developers,
+                                               days_back=preferences.get('days_back', 7), limit=per_method_limit))
+            
+            if len(self.token_pool) > 1:
+                # Each token has its own rate limit, so the methods can run side by side
+                with ThreadPoolExecutor(max_workers=len(self.token_pool)) as executor:
+                    found_lists = list(executor.map(lambda task: task(), tasks))
+                for login in itertools.chain.from_iterable(found_lists):
+                    all_discovered.setdefault(login.lower(), login)
+            else:
+                for task in tasks:
+                    if len(all_discovered) >= total_limit:
+                        break
+                    for login in task():
+                        all_discovered.setdefault(login.lower(), login)
             
-            final_list = list(all_discovered)[:total_limit]
+            final_list = list(all_discovered.values())[:total_limit]
             print(f"Comprehensive discovery completed: {len(final_list)} unique developers found")
             
             return final_list
             
         except Exception as e:
             print(f"Error in comprehensive discovery: {e}")
-            return list(all_discovered)[:total_limit]
+            return list(all_discovered.values())[:total_limit]
+
+class ETagCache:
+    """SQLite-backed store of (etag, body, fetched_at) per GitHub API request."""
+    
+    def __init__(self, path: str = ETAG_CACHE_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS etags (url TEXT PRIMARY KEY, etag TEXT NOT NULL, body TEXT NOT NULL, "
+                           "fetched_at REAL NOT NULL DEFAULT 0)")
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(etags)")]
+        if 'fetched_at' not in columns:
+            # Caches written before TTLs existed; their rows count as stale
+            self._conn.execute("ALTER TABLE etags ADD COLUMN fetched_at REAL NOT NULL DEFAULT 0")
+        self._conn.commit()
+        # Closed with the owning miner even if close() is never called
+        self._finalizer = weakref.finalize(self, self._conn.close)
+    
+    def get(self, url: str) -> Optional[tuple]:
+        """Return the cached (etag, body, fetched_at) for a request, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT etag, body, fetched_at FROM etags WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1]), row[2]
+    
+    def set(self, url: str, etag: str, body):
+        """Store the latest etag and response body for a request, stamped with the current time."""
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO etags (url, etag, body, fetched_at) VALUES (?, ?, ?, ?)",
+                               (url, etag, json.dumps(body), time.time()))
+            self._conn.commit()
+    
+    def touch(self, url: str):
+        """Mark a cached response as fresh again after GitHub confirmed it with a 304."""
+        with self._lock:
+            self._conn.execute("UPDATE etags SET fetched_at = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+    
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._finalizer()
 
 class AdvancedGitHubMiner:
-    def __init__(self, github_token: str = None, progress_callback=None, stop_event=None):
+    def __init__(self, github_token: str = None, progress_callback=None, stop_event=None, use_etag_cache: bool = True):
         if github_token is None:
             github_token = GITHUB_TOKEN
             
         if not github_token or github_token.strip() == "":
             raise ValueError("Invalid or empty GitHub token provided")
         self.token = github_token
-        self.progress_callback = progress_callback
+        # Worker threads report progress concurrently; serialize calls into the callback
+        self.progress_callback = self._serialized(progress_callback) if progress_callback else None
         self.stop_event = stop_event
         try:
-            self.github = Github(github_token)
+            self.github = Github(github_token, per_page=GITHUB_PER_PAGE, pool_size=GITHUB_POOL_SIZE)
             self.github.get_user().login
         except GithubException as e:
             raise ValueError(f"Invalid GitHub token: {e}")
-        self.headers = {'Authorization': f'token {github_token}'}
+        # Sent per request: the shared session also talks to hosts that must not see the token
+        self.headers = {'Authorization': f'bearer {github_token}'}
+        
+        # Per-username repository lists shared by all analyzers of a mining run
+        self._repos_cache = {}
+        self._original_repos_cache = {}
+        # Per-username {full_name: {'languages', 'topics'}} from REPO_DETAILS_QUERY
+        self._repo_details_cache = {}
+        # Per-username raw public events (one page of 100), read by two analyzers
+        self._events_cache = {}
+        # (analyzer, username, arguments) -> (stored at, result); a user seen again within
+        # USER_CACHE_TTL (e.g. a contributor of several mined repos) is not analyzed twice;
+        # bounded by USER_CACHE_MAX_ENTRIES so long runs keep memory flat
+        self._user_cache = OrderedDict()
+        self._user_cache_lock = threading.Lock()
+        # Bounds concurrent API calls across the user, analyzer and repo thread pools
+        self._api_semaphore = threading.BoundedSemaphore(GITHUB_MAX_CONCURRENT_CALLS)
+        self._api_local = threading.local()
+        
+        # Conditional requests let unchanged data be re-read without spending rate limit.
+        # Keys are namespaced by a token hash so one token's responses are never served to another.
+        self.etag_cache = ETagCache() if use_etag_cache else None
+        self._cache_namespace = hashlib.sha256(github_token.encode()).hexdigest()[:16]
+    
+    def close(self):
+        """Release the ETag cache's database connection."""
+        if self.etag_cache is not None:
+            self.etag_cache.close()
+    
+    @staticmethod
+    def _serialized(callback):
+        """Wrap a callback so concurrent callers invoke it one at a time."""
+        lock = threading.Lock()
+        
+        @functools.wraps(callback)
+        def wrapper(*args, **kwargs):
+            with lock:
+                return callback(*args, **kwargs)
+        return wrapper
+    
+    @github_retry
+    def _get_user(self, username: str):
+        """Fetch a user with rate-limit aware retries, reusing cached profiles for USER_CACHE_TTL."""
+        if self.etag_cache is not None:
+            return self.github.create_from_raw_data(NamedUser, self._conditional_get(f"/users/{username}", {}, USER_CACHE_TTL))
+        return self.github.get_user(username)
+    
+    @github_retry
+    def _get_repo(self, full_name: str):
+        """Fetch a repository with rate-limit aware retries, reusing cached metadata for REPO_CACHE_TTL."""
+        if self.etag_cache is not None:
+            return self.github.create_from_raw_data(Repository, self._conditional_get(f"/repos/{full_name}", {}, REPO_CACHE_TTL))
+        return self.github.get_repo(full_name)
+    
+    def _get_repo_languages(self, repo) -> Dict:
+        """A repository's language byte counts, revalidated by ETag when the cache is enabled."""
+        if self.etag_cache is not None:
+            return self._conditional_get(f"/repos/{repo.full_name}/languages", {}) or {}
+        return repo.get_languages()
+    
+    @staticmethod
+    def _get_repo_topics(repo) -> List[str]:
+        """A repository's topics; repo listings carry them inline, so this rarely costs a request."""
+        return repo.topics or []
+    
+    @github_retry
+    def _fetch_list(self, paginated) -> List:
+        """Materialize a PyGithub paginated list with rate-limit aware retries."""
+        return list(paginated)
+    
+    @github_retry
+    def _github_call(self, fn, *args, **kwargs):
+        """Call a PyGithub method with rate-limit aware retries."""
+        return fn(*args, **kwargs)
+    
+    @github_retry
+    def _conditional_get(self, url: str, parameters: Dict, ttl: float = 0, viewer_specific: bool = False):
+        """GET an API URL with If-None-Match, serving the cached body when GitHub answers 304.
+        
+        Responses younger than ``ttl`` seconds are served from the cache without a request.
+        Without an ETag cache, or for ``viewer_specific`` endpoints whose bodies can include
+        private data of the token's owner (e.g. user events), this is a plain GET.
+        """
+        if self.etag_cache is None or viewer_specific:
+            return self.github.requester.requestJsonAndCheck('GET', url, parameters)[1]
+        cache_key = f"{self._cache_namespace}:{url}?{'&'.join(f'{k}={v}' for k, v in sorted(parameters.items()))}"
+        cached = self.etag_cache.get(cache_key)
+        if cached and time.time() - cached[2] < ttl:
+            return cached[1]
+        headers = {'If-None-Match': cached[0]} if cached else None
+        
+        response_headers, data = self.github.requester.requestJsonAndCheck('GET', url, parameters, headers)
+        if data is None and cached:
+            # 304 Not Modified: nothing changed and no rate limit was spent
+            self.etag_cache.touch(cache_key)
+            return cached[1]
+        
+        etag = response_headers.get('etag')
+        if etag:
+            self.etag_cache.set(cache_key, etag, data)
+        return data
+    
+    @github_retry
+    def _gql(self, query: str, variables: Dict) -> Dict:
+        """POST a GraphQL query and return its data, raising GithubException so retries apply."""
+        response = _SESSION.post(GITHUB_GRAPHQL_URL, json={'query': query, 'variables': variables},
+                                 headers=self.headers, timeout=GITHUB_GRAPHQL_TIMEOUT)
+        headers = {k.lower(): v for k, v in response.headers.items()}
+        try:
+            payload = response.json()
+        except ValueError:
+            payload = {'message': response.text}
+        
+        errors = payload.get('errors') or []
+        if response.status_code >= 400 or not payload.get('data'):
+            rate_limited = any(error.get('type') == 'RATE_LIMITED' for error in errors)
+            raise GithubException(403 if rate_limited else response.status_code, payload, headers)
+        if errors:
+            logging.warning(f"GraphQL query returned partial data: {errors[0].get('message')}")
+        return payload['data']
+    
+    def _commit_history_pages(self, owner: str, repo_name: str, author_id: str, cursor: str) -> List[Dict]:
+        """Fetch the remaining pages of a repository's commit history after the given cursor."""
+        commits = []
+        while cursor and not (self.stop_event and self.stop_event.is_set()):
+            data = self._gql(COMMIT_HISTORY_QUERY, {'owner': owner, 'name': repo_name,
+                                                    'authorId': author_id, 'cursor': cursor})
+            branch = (data.get('repository') or {}).get('defaultBranchRef') or {}
+            history = (branch.get('target') or {}).get('history') or {}
+            commits.extend(history.get('nodes') or [])
+            page_info = history.get('pageInfo') or {}
+            cursor = page_info.get('endCursor') if page_info.get('hasNextPage') else None
+        return commits
+    
+    def _fetch_repos_conditionally(self, username: str) -> List:
+        """Page through a user's repositories using ETag-conditional requests."""
+        repos = []
+        page = 1
+        while True:
+            data = self._conditional_get(f"/users/{username}/repos", {'per_page': GITHUB_PER_PAGE, 'page': page,
+                                                                      'sort': 'pushed', 'direction': 'desc'},
+                                         REPO_CACHE_TTL) or []
+            repos.extend(self.github.create_from_raw_data(Repository, raw_repo) for raw_repo in data)
+            if len(data) < GITHUB_PER_PAGE:
+                return repos
+            page += 1
+    
+    def _fetch_contributor_logins(self, full_name: str, limit: int) -> List[str]:
+        """Page through a repository's top contributors using ETag-conditional requests."""
+        logins = []
+        page = 1
+        while len(logins) < limit:
+            data = self._conditional_get(f"/repos/{full_name}/contributors",
+                                         {'per_page': GITHUB_PER_PAGE, 'page': page}, REPO_CACHE_TTL) or []
+            logins.extend(contributor['login'] for contributor in data if contributor.get('login'))
+            if len(data) < GITHUB_PER_PAGE:
+                break
+            page += 1
+        return logins[:limit]
+    
+    def _get_repos(self, username: str) -> List:
+        """Return the user's repositories, most recently pushed first, fetching them only once per mining run."""
+        repos = self._repos_cache.get(username)
+        if repos is None:
+            if self.etag_cache is not None:
+                repos = self._fetch_repos_conditionally(username)
+            else:
+                repos = self._fetch_list(self._get_user(username).get_repos(sort='pushed', direction='desc'))
+            self._repos_cache[username] = repos
+        return repos
+    
+    def _get_original_repos(self, username: str) -> List:
+        """Return the user's non-fork repositories (cached alongside _get_repos)."""
+        original_repos = self._original_repos_cache.get(username)
+        if original_repos is None:
+            original_repos = [repo for repo in self._get_repos(username) if not repo.fork]
+            self._original_repos_cache[username] = original_repos
+        return original_repos
+    
+    @property
+    def last_rate_limit(self) -> Tuple[int, float]:
+        """(remaining core requests, reset epoch) as reported by the last API response."""
+        return self.github.rate_limiting[0], self.github.rate_limiting_resettime
+    
+    def _get_user_events(self, username: str) -> List[Dict]:
+        """Return the user's 100 most recent events as raw JSON, fetching them once per mining run."""
+        events = self._events_cache.get(username)
+        if events is None:
+            events = (self._conditional_get(f"/users/{username}/events", {'per_page': 100}, viewer_specific=True) or [])[:100]
+            self._events_cache[username] = events
+        return events
+    
+    def clear_repos_cache(self, username: Optional[str] = None):
+        """Drop cached repository data for one user, or for everyone, so it is refetched when next needed."""
+        for cache in (self._repos_cache, self._original_repos_cache, self._repo_details_cache, self._events_cache):
+            if username is None:
+                cache.clear()
+            else:
+                cache.pop(username, None)
+    
+    def _get_repo_details(self, username: str) -> Dict[str, Dict]:
+        """Return languages and topics for each of the user's repositories, keyed by full name.
+        
+        One GraphQL request covers 100 repositories, replacing a REST request per repository
+        and attribute. If GraphQL fails, whatever was fetched is kept and the rest falls back to REST.
+        """
+        details = self._repo_details_cache.get(username)
+        if details is None:
+            details = {}
+            cursor = None
+            try:
+                while True:
+                    data = self._gql(REPO_DETAILS_QUERY, {'login': username, 'cursor': cursor})
+                    repositories = (data.get('user') or {}).get('repositories') or {}
+                    for node in repositories.get('nodes') or []:
+                        details[node['nameWithOwner']] = {
+                            'languages': {edge['node']['name']: edge['size'] for edge in node['languages']['edges']},
+                            'topics': [topic_node['topic']['name'] for topic_node in node['repositoryTopics']['nodes']]
+                        }
+                    page_info = repositories.get('pageInfo') or {}
+                    if not page_info.get('hasNextPage'):
+                        break
+                    cursor = page_info['endCursor']
+            except (GithubException, requests.RequestException) as e:
+                logging.warning(f"Falling back to REST for repository details of {username}: {e}")
+            self._repo_details_cache[username] = details
+        return details
+    
+    def _get_repo_attribute(self, username: str, repos: List, key: str, fetch) -> List:
+        """Per-repo 'languages' or 'topics' in repo order, fetching over REST only what GraphQL did not return.
+        
+        Like _fetch_concurrently, REST failures come back as exceptions and skipped fetches as None.
+        """
+        details = self._get_repo_details(username)
+        missing = [repo for repo in repos if key not in details.get(repo.full_name, ())]
+        fetched = {}
+        for repo, value in zip(missing, self._fetch_concurrently(fetch, missing)):
+            if value is None or isinstance(value, GithubException):
+                fetched[repo.full_name] = value
+            else:
+                # Kept with the GraphQL details so the user's other analyzers reuse it
+                details.setdefault(repo.full_name, {})[key] = value
+        return [fetched[repo.full_name] if repo.full_name in fetched else details[repo.full_name][key] for repo in repos]
+        
+    def _fetch_concurrently(self, fn, items) -> List:
+        """Call fn on each item in a thread pool; results keep item order, failures are returned as exceptions."""
+        def run(item):
+            if self.stop_event and self.stop_event.is_set():
+                return None
+            try:
+                return self._github_call(fn, item)
+            except GithubException as e:
+                return e
+        
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(GITHUB_FETCH_WORKERS, len(items))) as executor:
+            return list(executor.map(run, items))
         
     def mine_github_archive(self, date_range: tuple, event_types: List[str] = None):
         if not isinstance(date_range, tuple) or len(date_range) != 2:
             raise ValueError("date_range must be a tuple of (start_date, end_date)")
         try:
-            start_date = datetime.strptime(date_range[0], '%Y-%m-%d')
-            end_date = datetime.strptime(date_range[1], '%Y-%m-%d')
+            for value in date_range:
+                if not isinstance(value, str) or not ISO_DATE_PATTERN.match(value):
+                    raise ValueError(f"'{value}' does not match format 'YYYY-MM-DD'")
+            start_date = datetime.fromisoformat(date_range[0])
+            end_date = datetime.fromisoformat(date_range[1])
             if start_date > end_date:
                 raise ValueError("start_date cannot be later than end_date")
         except ValueError as e:
@@ -365,27 +1305,60 @@ class AdvancedGitHubMiner:
         if event_types is None:
             event_types = ['PushEvent', 'PullRequestEvent', 'IssuesEvent', 'CreateEvent']
         
-        events_data = []
+        # Event timestamps stay as the archive's ISO strings; nothing here needs them parsed
+        urls = []
         current_date = start_date
         while current_date <= end_date:
-            for hour in range(24):
-                date_str = current_date.strftime('%Y-%m-%d')
-                url = f"https://data.gharchive.org/{date_str}-{hour}.json.gz"
-                try:
-                    logging.info(f"Processing: {url}")
-                except Exception as e:
-                    logging.error(f"Error processing {url}: {e}")
-                    continue
+            date_str = current_date.date().isoformat()
+            urls.extend(GHARCHIVE_URL_TEMPLATE.format(date_str, hour) for hour in range(24))
             current_date += timedelta(days=1)
         
+        wanted_types = frozenset(event_types)
+        events_data = []
+        with ThreadPoolExecutor(max_workers=min(GHARCHIVE_FETCH_WORKERS, len(urls))) as executor:
+            for events in executor.map(lambda url: self._fetch_archive_events(url, wanted_types), urls):
+                events_data.extend(events)
+        
         return events_data
     
+    def _fetch_archive_events(self, url: str, wanted_types: frozenset) -> List[Dict]:
+        """Download one hourly gharchive file and keep the events of the wanted types."""
+        if self.stop_event and self.stop_event.is_set():
+            return []
+        loads = orjson.loads if orjson is not None else json.loads
+        wanted_type_bytes = frozenset(event_type.encode() for event_type in wanted_types)
+        events = []
+        try:
+            logging.info(f"Processing: {url}")
+            # Decompress while downloading instead of holding the whole archive in memory
+            with _SESSION.get(url, stream=True, timeout=GHARCHIVE_TIMEOUT) as response:
+                response.raise_for_status()
+                with gzip.GzipFile(fileobj=response.raw) as archive:
+                    for line in archive:
+                        # Lines are compact and start {"id":"...","type":"...", so an unwanted event can be
+                        # skipped without parsing; anything not read in full here is checked after loads
+                        start = line.find(b'"type":"', 0, GHARCHIVE_TYPE_SCAN_BYTES) + 8
+                        end = line.find(b'"', start, GHARCHIVE_TYPE_SCAN_BYTES) if start > 7 else -1
+                        if end > 0 and line[start:end] not in wanted_type_bytes:
+                            continue
+                        event = loads(line)
+                        if event.get('type') in wanted_types:
+                            events.append({
+                                'type': event['type'],
+                                'actor': (event.get('actor') or {}).get('login'),
+                                'repo': (event.get('repo') or {}).get('name'),
+                                'created_at': event.get('created_at')
+                            })
+        except Exception as e:
+            logging.error(f"Error processing {url}: {e}")
+        return events
+    
     def get_contributor_network(self, repo_owner: str, repo_name: str) -> Dict:
         if not repo_owner or not repo_name:
             raise ValueError("repo_owner and repo_name cannot be empty")
         
         try:
-            repo = self.github.get_repo(f"{repo_owner}/{repo_name}")
+            repo = self._get_repo(f"{repo_owner}/{repo_name}")
             contributor_data = []
             
             try:
@@ -424,13 +1397,93 @@ class AdvancedGitHubMiner:
             logging.error(f"Error getting contributor network for {repo_owner}/{repo_name}: {e}")
             return {}
     
+    def _collect_repo_patterns(self, repo: Dict, username: str, author_id: str) -> Optional[Dict]:
+        """Build the development-pattern entries for one GraphQL repository node."""
+        patterns = {
+            'commit_frequency': [],
+            'repository_lifecycle': [],
+            'language_evolution': {},
+            'commit_comments': [],
+            'issue_comments': [],
+            'pr_reviews': []
+        }
+        try:
+            repo_name = repo['name']
+            branch = repo.get('defaultBranchRef') or {}
+            history = (branch.get('target') or {}).get('history') or {}
+            commits = history.get('nodes') or []
+            page_info = history.get('pageInfo') or {}
+            if page_info.get('hasNextPage'):
+                commits = commits + self._commit_history_pages(username, repo_name, author_id,
+                                                               page_info.get('endCursor'))
+            
+            commit_dates = [_parse_github_datetime(commit['authoredDate']) for commit in commits]
+            patterns['commit_frequency'].extend(commit_dates)
+            
+            if commit_dates:
+                first_commit = min(commit_dates)
+                last_commit = max(commit_dates)
+                lifecycle_days = (last_commit - first_commit).days
+                patterns['repository_lifecycle'].append({
+                    'repo_name': repo_name,
+                    'lifecycle_days': lifecycle_days,
+                    'total_commits': len(commits),
+                    'commits_per_day': len(commits) / max(lifecycle_days, 1)
+                })
+            
+            repo_date = _parse_github_datetime(repo.get('createdAt'))
+            for edge in (repo.get('languages') or {}).get('edges') or []:
+                patterns['language_evolution'].setdefault(edge['node']['name'], []).append({
+                    'date': repo_date,
+                    'bytes': edge['size'],
+                    'repo': repo_name
+                })
+            
+            for commit in commits[:50]:
+                for comment in (commit.get('comments') or {}).get('nodes') or []:
+                    if (comment.get('author') or {}).get('login') == username:
+                        patterns['commit_comments'].append({
+                            'repo': repo_name,
+                            'commit_sha': commit['oid'],
+                            'comment_body': comment['body'],
+                            'created_at': _parse_github_datetime(comment['createdAt'])
+                        })
+            
+            for issue in (repo.get('issues') or {}).get('nodes') or []:
+                for comment in (issue.get('comments') or {}).get('nodes') or []:
+                    if (comment.get('author') or {}).get('login') == username:
+                        patterns['issue_comments'].append({
+                            'repo': repo_name,
+                            'issue_number': issue['number'],
+                            'comment_body': comment['body'],
+                            'created_at': _parse_github_datetime(comment['createdAt'])
+                        })
+            
+            for pr in (repo.get('pullRequests') or {}).get('nodes') or []:
+                for review in (pr.get('reviews') or {}).get('nodes') or []:
+                    if (review.get('author') or {}).get('login') == username:
+                        patterns['pr_reviews'].append({
+                            'repo': repo_name,
+                            'pr_number': pr['number'],
+                            'review_state': review['state'],
+                            'review_body': review['body'],
+                            'submitted_at': _parse_github_datetime(review['submittedAt'])
+                        })
+        
+        except Exception as e:
+            logging.error(f"Error processing repository {repo.get('name')} for user {username}: {e}")
+            return None
+        return patterns
+    
+    @cached_per_user
     def analyze_development_patterns(self, username: str) -> Dict:
         if not username:
             raise ValueError("username cannot be empty")
         
         try:
-            user = self.github.get_user(username)
-            repos = list(user.get_repos())
+            author_id = self._get_user(username).node_id
+            data = self._gql(DEVELOPMENT_PATTERNS_QUERY, {'login': username, 'authorId': author_id})
+            repos = ((data.get('user') or {}).get('repositories') or {}).get('nodes') or []
             
             patterns = {
                 'commit_frequency': [],
@@ -443,108 +1496,36 @@ class AdvancedGitHubMiner:
                 'pr_reviews': []
             }
             
-            for repo in repos[:10]:
-                try:
-                    if repo.fork:
-                        logging.info(f"Skipping fork: {repo.name} for user {username}")
-                        continue
-                    
-                    commits = list(repo.get_commits(author=username))
-                    commit_dates = [commit.commit.author.date for commit in commits]
-                    patterns['commit_frequency'].extend(commit_dates)
-                    
-                    for date in commit_dates:
-                        patterns['commit_timing']['hours'].append(date.hour)
-                        patterns['commit_timing']['days'].append(date.weekday())
-                    
-                    if commit_dates:
-                        first_commit = min(commit_dates)
-                        last_commit = max(commit_dates)
-                        lifecycle_days = (last_commit - first_commit).days
-                        patterns['repository_lifecycle'].append({
-                            'repo_name': repo.name,
-                            'lifecycle_days': lifecycle_days,
-                            'total_commits': len(commits),
-                            'commits_per_day': len(commits) / max(lifecycle_days, 1)
-                        })
-                    
-                    languages = repo.get_languages()
-                    repo_date = repo.created_at
-                    for lang, bytes_count in languages.items():
-                        if lang not in patterns['language_evolution']:
-                            patterns['language_evolution'][lang] = []
-                        patterns['language_evolution'][lang].append({
-                            'date': repo_date,
-                            'bytes': bytes_count,
-                            'repo': repo.name
-                        })
-                    
-                    for commit in commits[:50]:
-                        try:
-                            comments = commit.get_comments()
-                            for comment in comments:
-                                if comment.user and comment.user.login == username:
-                                    patterns['commit_comments'].append({
-                                        'repo': repo.name,
-                                        'commit_sha': commit.sha,
-                                        'comment_body': comment.body,
-                                        'created_at': comment.created_at
-                                    })
-                        except GithubException as e:
-                            logging.warning(f"Error fetching commit comments for {repo.name}: {e}")
-                    
-                    try:
-                        issues = repo.get_issues(creator=username, state='all')
-                        for issue in issues[:50]:
-                            comments = issue.get_comments()
-                            for comment in comments:
-                                if comment.user and comment.user.login == username:
-                                    patterns['issue_comments'].append({
-                                        'repo': repo.name,
-                                        'issue_number': issue.number,
-                                        'comment_body': comment.body,
-                                        'created_at': comment.created_at
-                                    })
-                    except GithubException as e:
-                        logging.warning(f"Error fetching issues for {repo.name}: {e}")
-                    
-                    try:
-                        prs = repo.get_pulls(state='all')
-                        for pr in prs[:50]:
-                            reviews = pr.get_reviews()
-                            for review in reviews:
-                                if review.user and review.user.login == username:
-                                    patterns['pr_reviews'].append({
-                                        'repo': repo.name,
-                                        'pr_number': pr.number,
-                                        'review_state': review.state,
-                                        'review_body': review.body,
-                                        'submitted_at': review.submitted_at
-                                    })
-                    except GithubException as e:
-                        logging.warning(f"Error fetching pull requests for {repo.name}: {e}")
-                
-                except Exception as e:
-                    logging.error(f"Error processing repository {repo.name} for user {username}: {e}")
+            # Only repos with long histories make further requests, but those overlap
+            with ThreadPoolExecutor(max_workers=max(1, min(GITHUB_FETCH_WORKERS, len(repos)))) as executor:
+                repo_patterns = list(executor.map(lambda repo: self._collect_repo_patterns(repo, username, author_id), repos))
+            
+            for partial in repo_patterns:
+                if partial is None:
                     continue
+                patterns['commit_frequency'].extend(partial['commit_frequency'])
+                patterns['repository_lifecycle'].extend(partial['repository_lifecycle'])
+                for lang, entries in partial['language_evolution'].items():
+                    patterns['language_evolution'].setdefault(lang, []).extend(entries)
+                for key in ('commit_comments', 'issue_comments', 'pr_reviews'):
+                    patterns[key].extend(partial[key])
             
             if patterns['commit_frequency']:
-                sorted_dates = sorted(set(date.date() for date in patterns['commit_frequency']))
-                current_streak = 1
-                max_streak = 1
-                for i in range(1, len(sorted_dates)):
-                    if (sorted_dates[i] - sorted_dates[i-1]).days == 1:
-                        current_streak += 1
-                        max_streak = max(max_streak, current_streak)
-                    else:
-                        current_streak = 1
+                commit_index = pd.DatetimeIndex(patterns['commit_frequency'])
+                patterns['commit_timing']['hours'] = commit_index.hour.tolist()
+                patterns['commit_timing']['days'] = commit_index.weekday.tolist()
+                
+                # Distinct commit days as day ordinals; a streak is a run of consecutive ordinals
+                active_days = np.unique(commit_index.values.astype('datetime64[D]').astype(np.int64))
+                breaks = np.flatnonzero(np.diff(active_days) != 1)
+                runs = np.diff(np.concatenate(([-1], breaks, [len(active_days) - 1])))
                 patterns['productivity_streaks'] = {
-                    'max_streak': max_streak,
-                    'total_active_days': len(sorted_dates)
+                    'max_streak': int(runs.max()),
+                    'total_active_days': len(active_days)
                 }
             
             return patterns
-        except GithubException as e:
+        except (GithubException, requests.RequestException) as e:
             logging.error(f"Error analyzing development patterns for {username}: {e}")
             return {}
     
@@ -553,11 +1534,15 @@ class AdvancedGitHubMiner:
             raise ValueError("repo_owner and repo_name cannot be empty")
         
         try:
-            repo = self.github.get_repo(f"{repo_owner}/{repo_name}")
+            repo = self._get_repo(f"{repo_owner}/{repo_name}")
             issue_data = []
             
             try:
-                issues = repo.get_issues(state='all')
+                issues = self._fetch_list(repo.get_issues(state='all'))
+                # Comment threads are independent requests; skip issues that have none
+                commented = [issue for issue in issues if issue.comments]
+                comment_lists = dict(zip((issue.number for issue in commented),
+                                         self._fetch_concurrently(lambda issue: list(issue.get_comments()), commented)))
                 for issue in issues:
                     issue_info = {
                         'number': issue.number,
@@ -575,16 +1560,16 @@ class AdvancedGitHubMiner:
                     if issue.closed_at:
                         issue_info['resolution_time_hours'] = (issue.closed_at - issue.created_at).total_seconds() / 3600
                     
-                    try:
-                        comments = issue.get_comments()
-                        for comment in comments:
-                            issue_info['comments'].append({
-                                'user': comment.user.login if comment.user else None,
-                                'body': comment.body,
-                                'created_at': comment.created_at
-                            })
-                    except GithubException as e:
-                        logging.warning(f"Error fetching comments for issue {issue.number} in {repo_owner}/{repo_name}: {e}")
+                    comments = comment_lists.get(issue.number) or []
+                    if isinstance(comments, GithubException):
+                        logging.warning(f"Error fetching comments for issue {issue.number} in {repo_owner}/{repo_name}: {comments}")
+                        comments = []
+                    for comment in comments:
+                        issue_info['comments'].append({
+                            'user': comment.user.login if comment.user else None,
+                            'body': comment.body,
+                            'created_at': comment.created_at
+                        })
                     
                     issue_data.append(issue_info)
             except GithubException as e:
@@ -595,61 +1580,50 @@ class AdvancedGitHubMiner:
             logging.error(f"Error collecting issue data for {repo_owner}/{repo_name}: {e}")
             return []
     
+    @cached_per_user
     def collect_extended_user_data(self, username: str) -> Dict:
         if not username:
             raise ValueError("username cannot be empty")
         
         try:
-            user = self.github.get_user(username)
+            # Everything but events comes from one GraphQL query; events are REST-only, so fetch them alongside
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                events_future = executor.submit(self._get_user_events, username)
+                user = self._gql(EXTENDED_USER_QUERY, {'login': username}).get('user')
+            if user is None:
+                logging.error(f"Error collecting extended user data for {username}: user not found")
+                return {}
+            
             extended_data = {
-                'email': user.email,
-                'location': user.location,
-                'bio': user.bio,
-                'company': user.company,
-                'blog': user.blog,
-                'twitter_username': user.twitter_username,
-                'hireable': user.hireable,
-                'public_gists': user.public_gists,
-                'avatar_url': user.avatar_url,
-                'starred_repos': [],
-                'watched_repos': [],
-                'gists': [],
-                'organizations': [],
+                'email': user['email'] or None,  # GraphQL returns '' for a hidden email where REST returned null
+                'location': user['location'],
+                'bio': user['bio'],
+                'company': user['company'],
+                'blog': user['websiteUrl'],
+                'twitter_username': user['twitterUsername'],
+                'hireable': user['isHireable'],
+                'public_gists': user['publicGists']['totalCount'],
+                'avatar_url': user['avatarUrl'],
+                # REST reported stargazers as watchers_count, so watched repos keep the star count
+                'starred_repos': [{'full_name': repo['nameWithOwner'], 'stars': repo['stargazerCount']}
+                                  for repo in user['starredRepositories']['nodes']],
+                'watched_repos': [{'full_name': repo['nameWithOwner'], 'watchers': repo['stargazerCount']}
+                                  for repo in user['watching']['nodes']],
+                'gists': [{'id': gist['name'], 'description': gist['description'], 'created_at': _parse_github_datetime(gist['createdAt'])}
+                          for gist in user['recentGists']['nodes']],
+                'organizations': [{'login': org['login'], 'description': org['description']} for org in user['organizations']['nodes']],
                 'events': []
             }
             
             try:
-                starred = user.get_starred()
-                extended_data['starred_repos'] = [{'full_name': repo.full_name, 'stars': repo.stargazers_count} for repo in starred[:10]]
-            except GithubException as e:
-                logging.warning(f"Error fetching starred repos for {username}: {e}")
-            
-            try:
-                watched = user.get_watched()
-                extended_data['watched_repos'] = [{'full_name': repo.full_name, 'watchers': repo.watchers_count} for repo in watched[:10]]
-            except GithubException as e:
-                logging.warning(f"Error fetching watched repos for {username}: {e}")
-            
-            try:
-                gists = user.get_gists()
-                extended_data['gists'] = [{'id': gist.id, 'description': gist.description, 'created_at': gist.created_at} for gist in gists[:10]]
-            except GithubException as e:
-                logging.warning(f"Error fetching gists for {username}: {e}")
-            
-            try:
-                orgs = user.get_orgs()
-                extended_data['organizations'] = [{'login': org.login, 'description': org.description} for org in orgs]
-            except GithubException as e:
-                logging.warning(f"Error fetching organizations for {username}: {e}")
-            
-            try:
-                events = user.get_events()
-                extended_data['events'] = [{'type': event.type, 'repo': event.repo.name, 'created_at': event.created_at} for event in events[:50]]
+                events = events_future.result()
+                extended_data['events'] = [{'type': event['type'], 'repo': event['repo']['name'], 'created_at': _parse_github_datetime(event['created_at'])}
+                                           for event in events[:50]]
             except GithubException as e:
                 logging.warning(f"Error fetching events for {username}: {e}")
             
             return extended_data
-        except GithubException as e:
+        except (GithubException, requests.RequestException) as e:
             logging.error(f"Error collecting extended user data for {username}: {e}")
             return {}
     
@@ -658,61 +1632,150 @@ class AdvancedGitHubMiner:
             raise ValueError("repo_owner and repo_name cannot be empty")
         
         try:
-            repo = self.github.get_repo(f"{repo_owner}/{repo_name}")
+            full_name = f"{repo_owner}/{repo_name}"
+            repo = self._get_repo(full_name)
             extended_data = {
                 'branches': [],
                 'releases': [],
                 'tags': [],
                 'commit_stats': [],
                 'code_frequency': [],
-                'topics': repo.get_topics(),
+                'topics': [],
                 'license': repo.license.name if repo.license else None,
                 'forks_history': []
             }
             
-            try:
-                branches = repo.get_branches()
-                extended_data['branches'] = [{'name': branch.name, 'protected': branch.protected} for branch in branches[:10]]
-            except GithubException as e:
-                logging.warning(f"Error fetching branches for {repo_owner}/{repo_name}: {e}")
-            
-            try:
-                releases = repo.get_releases()
-                extended_data['releases'] = [{'tag_name': release.tag_name, 'created_at': release.created_at} for release in releases[:10]]
-            except GithubException as e:
-                logging.warning(f"Error fetching releases for {repo_owner}/{repo_name}: {e}")
-            
-            try:
-                tags = repo.get_tags()
-                extended_data['tags'] = [{'name': tag.name, 'commit_sha': tag.commit.sha} for tag in tags[:10]]
-            except GithubException as e:
-                logging.warning(f"Error fetching tags for {repo_owner}/{repo_name}: {e}")
+            # (key, label for warnings, fetch) - independent requests, so they run side by side.
+            # Branches, releases, tags and forks rarely change and are revalidated by ETag (a 304 is free).
+            fetchers = [
+                ('topics', 'topics', lambda: self._get_repo_topics(repo)),
+                ('branches', 'branches', lambda: [{'name': branch['name'], 'protected': branch['protected']}
+                                                  for branch in (self._conditional_get(f"/repos/{full_name}/branches", {'per_page': 10}) or [])[:10]]),
+                ('releases', 'releases', lambda: [{'tag_name': release['tag_name'], 'created_at': _parse_github_datetime(release['created_at'])}
+                                                  for release in (self._conditional_get(f"/repos/{full_name}/releases", {'per_page': 10}) or [])[:10]]),
+                ('tags', 'tags', lambda: [{'name': tag['name'], 'commit_sha': tag['commit']['sha']}
+                                          for tag in (self._conditional_get(f"/repos/{full_name}/tags", {'per_page': 10}) or [])[:10]]),
+                ('commit_stats', 'commit stats', lambda: [{'week': stat.week, 'total': stat.total}
+                                                          for stat in self._github_call(repo.get_stats_commit_activity) or []]),
+                ('code_frequency', 'code frequency', lambda: [{'week': stat.week, 'additions': stat.additions, 'deletions': stat.deletions}
+                                                              for stat in self._github_call(repo.get_stats_code_frequency) or []]),
+                ('forks_history', 'forks', lambda: [{'owner': fork['owner']['login'], 'created_at': _parse_github_datetime(fork['created_at'])}
+                                                    for fork in (self._conditional_get(f"/repos/{full_name}/forks", {'per_page': 10}) or [])[:10]])
+            ]
+            
+            def run(fetch):
+                # Any failure (API error, missing field, connection error) only loses this fetcher's field
+                try:
+                    return fetch()
+                except Exception as e:
+                    return e
             
-            try:
-                stats = repo.get_stats_commit_activity()
-                if stats:
-                    extended_data['commit_stats'] = [{'week': stat.week, 'total': stat.total} for stat in stats]
-            except GithubException as e:
-                logging.warning(f"Error fetching commit stats for {repo_owner}/{repo_name}: {e}")
+            with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+                results = list(executor.map(run, [fetch for _, _, fetch in fetchers]))
+            for (key, label, _), result in zip(fetchers, results):
+                if isinstance(result, Exception):
+                    logging.warning(f"Error fetching {label} for {repo_owner}/{repo_name}: {result}")
+                else:
+                    extended_data[key] = result
             
+            return extended_data
+        except GithubException as e:
+            logging.error(f"Error collecting extended repo data for {repo_owner}/{repo_name}: {e}")
+            return {}
+    
+    def _recent_repo_commits_graphql(self, repo, author_id: str, cutoff_date: datetime) -> List[Dict]:
+        """Fetch a repo's commits by author_id since cutoff_date, stats included, as recent_commits entries."""
+        owner, repo_name = repo.full_name.split('/', 1)
+        since = cutoff_date.strftime('%Y-%m-%dT%H:%M:%SZ')
+        commit_entries = []
+        cursor = None
+        while True:
+            data = self._gql(RECENT_COMMITS_QUERY, {'owner': owner, 'name': repo_name, 'authorId': author_id,
+                                                    'since': since, 'cursor': cursor})
+            branch = (data.get('repository') or {}).get('defaultBranchRef') or {}
+            history = (branch.get('target') or {}).get('history') or {}
+            for commit in history.get('nodes') or []:
+                commit_entries.append({
+                    'repo': repo.name,
+                    'sha': commit['oid'],
+                    'message': (commit.get('message') or "")[:100],
+                    'date': _parse_github_datetime(commit['authoredDate']),
+                    'additions': commit.get('additions') or 0,
+                    'deletions': commit.get('deletions') or 0
+                })
+            page_info = history.get('pageInfo') or {}
+            cursor = page_info.get('endCursor') if page_info.get('hasNextPage') else None
+            if not cursor or (self.stop_event and self.stop_event.is_set()):
+                return commit_entries
+    
+    def _recent_repo_commits(self, repo, username: str, cutoff_date: datetime,
+                             author_id: Optional[str] = None) -> Optional[List[Dict]]:
+        """Return a repo's commits by username since cutoff_date as recent_commits entries, or None if they could not be fetched."""
+        if author_id:
             try:
-                code_freq = repo.get_stats_code_frequency()
-                if code_freq:
-                    extended_data['code_frequency'] = [{'week': stat.week, 'additions': stat.additions, 'deletions': stat.deletions} for stat in code_freq]
+                return self._recent_repo_commits_graphql(repo, author_id, cutoff_date)
             except GithubException as e:
-                logging.warning(f"Error fetching code frequency for {repo_owner}/{repo_name}: {e}")
-            
+                logging.warning(f"GraphQL commit history failed for {repo.name}, falling back to REST: {e}")
+        
+        try:
+            # Try different approaches to get commits
+            commits = []
             try:
-                forks = repo.get_forks()
-                extended_data['forks_history'] = [{'owner': fork.owner.login, 'created_at': fork.created_at} for fork in forks[:10]]
+                # Method 1: Get commits by author since cutoff date
+                commits = self._fetch_list(repo.get_commits(author=username, since=cutoff_date))
             except GithubException as e:
-                logging.warning(f"Error fetching forks for {repo_owner}/{repo_name}: {e}")
-            
-            return extended_data
+                logging.warning(f"Method 1 failed for {repo.name}: {e}")
+                try:
+                    # Method 2: Get recent commits and filter by author
+                    all_commits = self._fetch_list(repo.get_commits(since=cutoff_date))
+                    commits = [c for c in all_commits if c.author and c.author.login == username]
+                except GithubException as e2:
+                    logging.warning(f"Method 2 failed for {repo.name}: {e2}")
+                    try:
+                        # Method 3: Get commits without date filter and filter manually
+                        recent_commits = self._fetch_list(repo.get_commits()[:50])  # Get last 50 commits
+                        commits = [c for c in recent_commits
+                                   if c.author and c.author.login == username and c.commit.author.date >= cutoff_date]
+                    except GithubException as e3:
+                        logging.warning(f"Method 3 failed for {repo.name}: {e3}")
+                        return None
+            
+            commit_entries = []
+            for commit in commits:
+                try:
+                    commit_date = commit.commit.author.date
+                    
+                    # Get commit stats safely (REST fallback only: one extra request per commit)
+                    additions = 0
+                    deletions = 0
+                    try:
+                        if commit.stats:
+                            additions = commit.stats.additions
+                            deletions = commit.stats.deletions
+                    except:
+                        pass
+                    
+                    commit_entries.append({
+                        'repo': repo.name,
+                        'sha': commit.sha,
+                        'message': commit.commit.message[:100] if commit.commit.message else "",
+                        'date': commit_date,
+                        'additions': additions,
+                        'deletions': deletions
+                    })
+                except Exception as e:
+                    logging.warning(f"Error processing commit {commit.sha}: {e}")
+                    continue
+            return commit_entries
+        
         except GithubException as e:
-            logging.error(f"Error collecting extended repo data for {repo_owner}/{repo_name}: {e}")
-            return {}
+            logging.warning(f"Error getting commits for repo {repo.name}: {e}")
+            return None
+        except Exception as e:
+            logging.error(f"Unexpected error analyzing repo {repo.name}: {e}")
+            return None
     
+    @cached_per_user
     def analyze_commit_activity(self, username: str, days: int = 90) -> Dict:
         """Analyze recent commit activity for a user."""
         if not username:
@@ -722,15 +1785,14 @@ class AdvancedGitHubMiner:
             if self.stop_event and self.stop_event.is_set():
                 return {}
             
-            user = self.github.get_user(username)
-            repos = list(user.get_repos())
+            original_repos = self._get_original_repos(username)
             
-            # Use timezone-naive datetime to avoid issues
-            cutoff_date = datetime.now() - timedelta(days=days)
+            # Aware UTC, like the API timestamps it is compared with, so no per-commit tzinfo stripping
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
             
             activity_data = {
                 'total_recent_commits': 0,
-                'active_days': set(),
+                'active_days': [],
                 'commit_frequency_by_day': {},
                 'commit_frequency_by_hour': {},
                 'recent_commits': [],
@@ -738,113 +1800,62 @@ class AdvancedGitHubMiner:
                 'commit_streaks': [],
                 'avg_commits_per_day': 0,
                 'repositories_analyzed': 0,
-                'total_repositories': len([r for r in repos if not r.fork])
+                'total_repositories': len(original_repos)
             }
             
             repo_commit_counts = {}
+            repos_to_analyze = original_repos[:15]  # Limit to avoid rate limits
             
-            # Filter out forks and get only user's original repos
-            original_repos = [repo for repo in repos if not repo.fork]
+            try:
+                author_id = self._get_user(username).node_id
+            except (GithubException, AttributeError) as e:
+                logging.warning(f"Could not resolve node id for {username}, using REST commit listings: {e}")
+                author_id = None
             
-            for repo in original_repos[:15]:  # Limit to avoid rate limits
-                try:
-                    if self.stop_event and self.stop_event.is_set():
-                        break
-                    
-                    activity_data['repositories_analyzed'] += 1
-                    logging.info(f"Analyzing commits for repo: {repo.name}")
-                    
-                    # Try different approaches to get commits
-                    commits = []
-                    try:
-                        # Method 1: Get commits by author since cutoff date
-                        commits = list(repo.get_commits(author=username, since=cutoff_date))
-                    except GithubException as e:
-                        logging.warning(f"Method 1 failed for {repo.name}: {e}")
-                        try:
-                            # Method 2: Get recent commits and filter by author
-                            all_commits = list(repo.get_commits(since=cutoff_date))
-                            commits = [c for c in all_commits if c.author and c.author.login == username]
-                        except GithubException as e2:
-                            logging.warning(f"Method 2 failed for {repo.name}: {e2}")
-                            try:
-                                # Method 3: Get commits without date filter and filter manually
-                                recent_commits = list(repo.get_commits()[:50])  # Get last 50 commits
-                                commits = []
-                                for c in recent_commits:
-                                    if c.author and c.author.login == username:
-                                        commit_date = c.commit.author.date
-                                        if commit_date.tzinfo:
-                                            commit_date = commit_date.replace(tzinfo=None)
-                                        if commit_date >= cutoff_date:
-                                            commits.append(c)
-                            except GithubException as e3:
-                                logging.warning(f"Method 3 failed for {repo.name}: {e3}")
-                                continue
-                    
-                    repo_commits = 0
-                    
-                    for commit in commits:
-                        try:
-                            commit_date = commit.commit.author.date
-                            activity_data['total_recent_commits'] += 1
-                            repo_commits += 1
-                            
-                            # Convert to naive datetime for consistency
-                            if commit_date.tzinfo:
-                                commit_date = commit_date.replace(tzinfo=None)
-                            
-                            day_key = commit_date.strftime('%Y-%m-%d')
-                            hour_key = str(commit_date.hour)
-                            
-                            activity_data['active_days'].add(day_key)
-                            activity_data['commit_frequency_by_day'][day_key] = activity_data['commit_frequency_by_day'].get(day_key, 0) + 1
-                            activity_data['commit_frequency_by_hour'][hour_key] = activity_data['commit_frequency_by_hour'].get(hour_key, 0) + 1
-                            
-                            # Get commit stats safely
-                            additions = 0
-                            deletions = 0
-                            try:
-                                if commit.stats:
-                                    additions = commit.stats.additions
-                                    deletions = commit.stats.deletions
-                            except:
-                                pass
-                            
-                            activity_data['recent_commits'].append({
-                                'repo': repo.name,
-                                'sha': commit.sha,
-                                'message': commit.commit.message[:100] if commit.commit.message else "",
-                                'date': commit_date,
-                                'additions': additions,
-                                'deletions': deletions
-                            })
-                        except Exception as e:
-                            logging.warning(f"Error processing commit {commit.sha}: {e}")
-                            continue
-                    
-                    repo_commit_counts[repo.name] = repo_commits
-                    logging.info(f"Found {repo_commits} commits in {repo.name}")
-                    
-                except GithubException as e:
-                    logging.warning(f"Error getting commits for repo {repo.name}: {e}")
+            def analyze_repo(repo):
+                if self.stop_event and self.stop_event.is_set():
+                    return False, None
+                return True, self._recent_repo_commits(repo, username, cutoff_date, author_id)
+            
+            # Repos are independent, so their commit listings (and per-commit stats) are fetched side by side
+            with ThreadPoolExecutor(max_workers=max(1, min(GITHUB_FETCH_WORKERS, len(repos_to_analyze)))) as executor:
+                repo_results = list(executor.map(analyze_repo, repos_to_analyze))
+            
+            for repo, (started, recent_commits) in zip(repos_to_analyze, repo_results):
+                if not started:
                     continue
-                except Exception as e:
-                    logging.error(f"Unexpected error analyzing repo {repo.name}: {e}")
+                activity_data['repositories_analyzed'] += 1
+                if recent_commits is None:
                     continue
+                
+                activity_data['recent_commits'].extend(recent_commits)
+                
+                activity_data['total_recent_commits'] += len(recent_commits)
+                repo_commit_counts[repo.name] = len(recent_commits)
             
             # Find most active repository
             if repo_commit_counts:
                 activity_data['most_active_repo'] = max(repo_commit_counts, key=repo_commit_counts.get)
             
-            # Calculate average commits per day
-            if activity_data['active_days']:
-                activity_data['avg_commits_per_day'] = activity_data['total_recent_commits'] / len(activity_data['active_days'])
-            
-            # Convert set to list for JSON serialization
-            activity_data['active_days'] = list(activity_data['active_days'])
+            if activity_data['recent_commits']:
+                # Day and hour tallies over one datetime64 array instead of per-commit dict updates
+                commit_times = pd.to_datetime([commit_info['date'] for commit_info in activity_data['recent_commits']],
+                                              utc=True).tz_localize(None).values.astype('datetime64[s]')
+                commit_days = commit_times.astype('datetime64[D]')
+                active_days, day_counts = np.unique(commit_days, return_counts=True)
+                hour_counts = np.bincount((commit_times - commit_days) // np.timedelta64(1, 'h'), minlength=24)
+                
+                activity_data['commit_frequency_by_day'] = {str(day): int(count) for day, count in zip(active_days, day_counts)}
+                activity_data['commit_frequency_by_hour'] = {str(hour): int(count) for hour, count in enumerate(hour_counts) if count}
+                # Strings rather than datetime64 values for JSON serialization
+                activity_data['active_days'] = [str(day) for day in active_days]
+                
+                # Calculate average commits per day
+                activity_data['avg_commits_per_day'] = activity_data['total_recent_commits'] / len(active_days)
             
-            logging.info(f"Commit activity analysis complete: {activity_data['total_recent_commits']} commits found")
+            # One summary line per user rather than two lines per repository
+            logging.info(f"Commit activity analysis complete: {activity_data['total_recent_commits']} commits found "
+                         f"in {activity_data['repositories_analyzed']} repos {repo_commit_counts}")
             return activity_data
             
         except GithubException as e:
@@ -854,6 +1865,7 @@ class AdvancedGitHubMiner:
             logging.error(f"Unexpected error in commit activity analysis for {username}: {e}")
             return {}
     
+    @cached_per_user
     def analyze_contribution_activity(self, username: str) -> Dict:
         """Analyze overall contribution activity and patterns for a user."""
         if not username:
@@ -863,7 +1875,7 @@ class AdvancedGitHubMiner:
             if self.stop_event and self.stop_event.is_set():
                 return {}
             
-            user = self.github.get_user(username)
+            user = self._get_user(username)
             
             contribution_data = {
                 'contribution_years': [],
@@ -884,45 +1896,49 @@ class AdvancedGitHubMiner:
             
             # Get user's events for contribution analysis
             try:
-                events = list(user.get_events()[:100])  # Get recent 100 events
+                # Raw event JSON (ETag-revalidated): PyGithub's Event.repo lacks full_name and would
+                # lazily GET every repository it is asked about
+                events = self._get_user_events(username)
                 contribution_data['recent_events_count'] = len(events)
                 
                 # Analyze different types of events
-                event_types = {}
+                event_types = Counter()
                 recent_contributions = 0
                 repositories_set = set()
+                # GitHub timestamps are fixed-width UTC ISO strings, so they compare correctly as text.
+                # "Last 30 days" keeps anything less than 31 whole days old, as it always has.
+                recent_events_cutoff = (datetime.now(timezone.utc) - timedelta(days=31)).strftime('%Y-%m-%dT%H:%M:%SZ')
+                # Bound once so the per-event check is a single call; bool() is False when there is no stop event
+                should_stop = self.stop_event.is_set if self.stop_event else bool
                 
                 for event in events:
                     try:
-                        if self.stop_event and self.stop_event.is_set():
+                        if should_stop():
                             break
                         
-                        event_type = event.type
-                        event_types[event_type] = event_types.get(event_type, 0) + 1
+                        event_type = event['type']
+                        event_types[event_type] += 1
                         
                         # Count recent contributions (last 30 days)
-                        event_date = event.created_at
-                        if event_date.tzinfo:
-                            event_date = event_date.replace(tzinfo=None)
-                        
-                        if (datetime.now() - event_date).days <= 30:
+                        if event['created_at'] > recent_events_cutoff:
                             recent_contributions += 1
                         
-                        # Track repositories contributed to
-                        if hasattr(event, 'repo') and event.repo:
-                            repositories_set.add(event.repo.full_name)
+                        # Track repositories contributed to (an event's repo name is already owner/name)
+                        if event.get('repo'):
+                            repositories_set.add(event['repo']['name'])
                         
                         # Specific event analysis
+                        action = (event.get('payload') or {}).get('action')
                         if event_type == 'IssuesEvent':
-                            if hasattr(event, 'payload') and event.payload.get('action') == 'opened':
+                            if action == 'opened':
                                 contribution_data['issues_opened'] += 1
-                            elif hasattr(event, 'payload') and event.payload.get('action') == 'closed':
+                            elif action == 'closed':
                                 contribution_data['issues_closed'] += 1
                         
                         elif event_type == 'PullRequestEvent':
-                            if hasattr(event, 'payload') and event.payload.get('action') == 'opened':
+                            if action == 'opened':
                                 contribution_data['pull_requests_opened'] += 1
-                            elif hasattr(event, 'payload') and event.payload.get('action') == 'closed':
+                            elif action == 'closed':
                                 contribution_data['pull_requests_merged'] += 1
                         
                         elif event_type == 'PushEvent':
@@ -932,7 +1948,7 @@ class AdvancedGitHubMiner:
                         logging.warning(f"Error processing event: {e}")
                         continue
                 
-                contribution_data['event_types'] = event_types
+                contribution_data['event_types'] = dict(event_types)
                 contribution_data['recent_contributions_30_days'] = recent_contributions
                 contribution_data['repositories_contributed_to'] = len(repositories_set)
                 
@@ -941,42 +1957,41 @@ class AdvancedGitHubMiner:
             
             # Analyze user's repositories for contribution patterns
             try:
-                repos = list(user.get_repos())
-                original_repos = [repo for repo in repos if not repo.fork]
+                repos = self._get_repos(username)
+                original_repos = self._get_original_repos(username)
                 
                 contribution_data['total_repositories'] = len(repos)
                 contribution_data['original_repositories'] = len(original_repos)
                 contribution_data['forked_repositories'] = len(repos) - len(original_repos)
                 
-                # Calculate total stars and forks earned
-                total_stars = sum(repo.stargazers_count for repo in original_repos)
-                total_forks = sum(repo.forks_count for repo in original_repos)
-                total_watchers = sum(repo.watchers_count for repo in original_repos)
+                # Calculate stars, forks, watchers and recent activity in a single pass
+                recent_cutoff = datetime.now(timezone.utc) - timedelta(days=90)
+                total_stars = total_forks = total_watchers = recent_count = 0
+                for repo in original_repos:
+                    total_stars += repo.stargazers_count
+                    total_forks += repo.forks_count
+                    total_watchers += repo.watchers_count
+                    recent_count += repo.updated_at >= recent_cutoff
                 
                 contribution_data['total_stars_earned'] = total_stars
                 contribution_data['total_forks_earned'] = total_forks
                 contribution_data['total_watchers_earned'] = total_watchers
-                
-                # Analyze repository activity patterns
-                recent_repos = [repo for repo in original_repos if (datetime.now() - repo.updated_at.replace(tzinfo=None) if repo.updated_at.tzinfo else repo.updated_at).days <= 90]
-                contribution_data['recently_active_repositories'] = len(recent_repos)
+                contribution_data['recently_active_repositories'] = recent_count
                 
                 # Calculate contribution level based on activity
-                if total_stars > 1000 or len(original_repos) > 50:
-                    contribution_data['contribution_level'] = 'High'
-                elif total_stars > 100 or len(original_repos) > 20:
-                    contribution_data['contribution_level'] = 'Medium'
-                elif total_stars > 10 or len(original_repos) > 5:
-                    contribution_data['contribution_level'] = 'Low'
-                else:
-                    contribution_data['contribution_level'] = 'Beginner'
+                original_count = len(original_repos)
+                contribution_data['contribution_level'] = next(
+                    (level for min_stars, min_repos, level in CONTRIBUTION_LEVELS
+                     if total_stars > min_stars or original_count > min_repos),
+                    'Beginner'
+                )
                 
             except GithubException as e:
                 logging.warning(f"Error analyzing repositories for {username}: {e}")
             
             # Get user's starred repositories for interest analysis
             try:
-                starred_repos = list(user.get_starred()[:20])  # Get first 20 starred repos
+                starred_repos = self._fetch_list(user.get_starred()[:20])  # Get first 20 starred repos
                 contribution_data['starred_repositories_count'] = len(starred_repos)
                 
                 # Analyze starred repositories' languages
@@ -1009,6 +2024,7 @@ class AdvancedGitHubMiner:
             logging.error(f"Unexpected error in contribution activity analysis for {username}: {e}")
             return {}
     
+    @cached_per_user
     def analyze_language_percentages(self, username: str) -> Dict:
         """Analyze language distribution across user's repositories."""
         if not username:
@@ -1018,37 +2034,28 @@ class AdvancedGitHubMiner:
             if self.stop_event and self.stop_event.is_set():
                 return {}
             
-            user = self.github.get_user(username)
-            repos = list(user.get_repos())
+            original_repos = self._get_original_repos(username)
             
-            language_data = {}
-            total_bytes = 0
+            language_data = Counter()
             
-            for repo in repos:
-                try:
-                    if self.stop_event and self.stop_event.is_set():
-                        break
-                    
-                    if repo.fork:
-                        continue
-                    
-                    languages = repo.get_languages()
-                    for lang, bytes_count in languages.items():
-                        language_data[lang] = language_data.get(lang, 0) + bytes_count
-                        total_bytes += bytes_count
-                        
-                except GithubException as e:
-                    logging.warning(f"Error getting languages for repo {repo.name}: {e}")
+            all_languages = self._get_repo_attribute(username, original_repos, 'languages', self._get_repo_languages)
+            for repo, languages in zip(original_repos, all_languages):
+                if languages is None:
+                    continue
+                if isinstance(languages, GithubException):
+                    logging.warning(f"Error getting languages for repo {repo.name}: {languages}")
                     continue
+                
+                language_data.update(languages)
+            total_bytes = sum(language_data.values())
             
-            # Calculate percentages
-            language_percentages = {}
+            # Percentages in descending byte order; most_common() sorts once, so no second pass over the percentages
+            sorted_languages = {}
             if total_bytes > 0:
-                for lang, bytes_count in language_data.items():
-                    language_percentages[lang] = round((bytes_count / total_bytes) * 100, 2)
-            
-            # Sort by percentage
-            sorted_languages = dict(sorted(language_percentages.items(), key=lambda x: x[1], reverse=True))
+                sorted_languages = {
+                    lang: round((bytes_count / total_bytes) * 100, 2)
+                    for lang, bytes_count in language_data.most_common()
+                }
             
             return {
                 'language_percentages': sorted_languages,
@@ -1061,6 +2068,7 @@ class AdvancedGitHubMiner:
             logging.error(f"Error analyzing language percentages for {username}: {e}")
             return {}
     
+    @cached_per_user
     def get_top_repositories(self, username: str, limit: int = 10) -> Dict:
         """Get user's top repositories by various metrics."""
         if not username:
@@ -1070,11 +2078,7 @@ class AdvancedGitHubMiner:
             if self.stop_event and self.stop_event.is_set():
                 return {}
             
-            user = self.github.get_user(username)
-            all_repos = list(user.get_repos())
-            
-            # Filter out forks
-            original_repos = [repo for repo in all_repos if not repo.fork]
+            original_repos = self._get_original_repos(username)
             
             if not original_repos:
                 return {
@@ -1091,15 +2095,23 @@ class AdvancedGitHubMiner:
             # Adjust limit based on available repositories
             actual_limit = min(limit, len(original_repos))
             
-            # Sort by different metrics
-            by_stars = sorted(original_repos, key=lambda r: r.stargazers_count, reverse=True)[:actual_limit]
-            by_forks = sorted(original_repos, key=lambda r: r.forks_count, reverse=True)[:actual_limit]
-            by_size = sorted(original_repos, key=lambda r: r.size, reverse=True)[:actual_limit]
-            by_watchers = sorted(original_repos, key=lambda r: r.watchers_count, reverse=True)[:actual_limit]
-            by_recent = sorted(original_repos, key=lambda r: r.updated_at, reverse=True)[:actual_limit]
+            # Rank by different metrics (partial selection instead of full sorts)
+            rankings = {
+                'by_stars': heapq.nlargest(actual_limit, original_repos, key=attrgetter('stargazers_count')),
+                'by_forks': heapq.nlargest(actual_limit, original_repos, key=attrgetter('forks_count')),
+                'by_size': heapq.nlargest(actual_limit, original_repos, key=attrgetter('size')),
+                'by_watchers': heapq.nlargest(actual_limit, original_repos, key=attrgetter('watchers_count')),
+                'by_recent_activity': heapq.nlargest(actual_limit, original_repos, key=attrgetter('updated_at'))
+            }
             
-            def repo_info(repo):
-                return {
+            # Repos often rank under several metrics; build each one's info (and fetch its topics) once
+            ranked_repos = list({repo.full_name: repo for ranked in rankings.values() for repo in ranked}.values())
+            all_topics = self._get_repo_attribute(username, ranked_repos, 'topics', self._get_repo_topics)
+            repo_infos = {}
+            for repo, topics in zip(ranked_repos, all_topics):
+                if isinstance(topics, GithubException):
+                    raise topics
+                repo_infos[repo.full_name] = {
                     'name': repo.name,
                     'full_name': repo.full_name,
                     'description': repo.description,
@@ -1110,24 +2122,30 @@ class AdvancedGitHubMiner:
                     'size': repo.size,
                     'created_at': repo.created_at,
                     'updated_at': repo.updated_at,
-                    'topics': repo.get_topics()
+                    'topics': topics or []
                 }
             
-            return {
-                'by_stars': [repo_info(repo) for repo in by_stars],
-                'by_forks': [repo_info(repo) for repo in by_forks],
-                'by_size': [repo_info(repo) for repo in by_size],
-                'by_watchers': [repo_info(repo) for repo in by_watchers],
-                'by_recent_activity': [repo_info(repo) for repo in by_recent],
-                'total_original_repos': len(original_repos),
-                'total_stars_earned': sum(repo.stargazers_count for repo in original_repos),
-                'total_forks_earned': sum(repo.forks_count for repo in original_repos)
+            total_stars = total_forks = 0
+            for repo in original_repos:
+                total_stars += repo.stargazers_count
+                total_forks += repo.forks_count
+            
+            top_repositories = {
+                metric: [dict(repo_infos[repo.full_name]) for repo in ranked]
+                for metric, ranked in rankings.items()
             }
+            top_repositories.update({
+                'total_original_repos': len(original_repos),
+                'total_stars_earned': total_stars,
+                'total_forks_earned': total_forks
+            })
+            return top_repositories
             
         except GithubException as e:
             logging.error(f"Error getting top repositories for {username}: {e}")
             return {}
     
+    @cached_per_user
     def analyze_interests(self, username: str) -> Dict:
         """Analyze user interests based on repositories, topics, and activity."""
         if not username:
@@ -1137,8 +2155,8 @@ class AdvancedGitHubMiner:
             if self.stop_event and self.stop_event.is_set():
                 return {}
             
-            user = self.github.get_user(username)
-            repos = list(user.get_repos())
+            user = self._get_user(username)
+            original_repos = self._get_original_repos(username)
             
             interests_data = {
                 'repository_topics': {},
@@ -1150,48 +2168,34 @@ class AdvancedGitHubMiner:
             }
             
             # Analyze repository topics and descriptions
-            for repo in repos:
-                try:
-                    if self.stop_event and self.stop_event.is_set():
-                        break
-                    
-                    if repo.fork:
-                        continue
-                    
-                    # Repository topics
-                    topics = repo.get_topics()
-                    for topic in topics:
-                        interests_data['repository_topics'][topic] = interests_data['repository_topics'].get(topic, 0) + 1
-                    
-                    # Language interests
-                    if repo.language:
-                        interests_data['language_interests'][repo.language] = interests_data['language_interests'].get(repo.language, 0) + 1
-                    
-                    # Keywords from descriptions
-                    if repo.description:
-                        # Simple keyword extraction (can be improved with NLP)
-                        words = re.findall(r'\b\w+\b', repo.description.lower())
-                        tech_keywords = ['api', 'web', 'mobile', 'data', 'machine', 'learning', 'ai', 'cloud', 'database', 'frontend', 'backend', 'devops', 'security', 'blockchain', 'iot', 'game', 'bot', 'cli', 'library', 'framework', 'tool', 'automation', 'testing', 'monitoring']
-                        for word in words:
-                            if word in tech_keywords and len(word) > 2:
-                                interests_data['description_keywords'][word] = interests_data['description_keywords'].get(word, 0) + 1
-                    
-                except GithubException as e:
-                    logging.warning(f"Error analyzing repo {repo.name}: {e}")
+            all_topics = self._get_repo_attribute(username, original_repos, 'topics', self._get_repo_topics)
+            analyzed_repos = []
+            should_stop = self.stop_event.is_set if self.stop_event else bool
+            for repo, topics in zip(original_repos, all_topics):
+                if should_stop():
+                    break
+                if isinstance(topics, GithubException):
+                    logging.warning(f"Error analyzing repo {repo.name}: {topics}")
                     continue
+                analyzed_repos.append((repo, topics or []))
+            
+            # Count each flattened stream in one Counter pass (first-seen order is kept)
+            interests_data['repository_topics'] = dict(Counter(
+                topic for _, topics in analyzed_repos for topic in topics))
+            interests_data['language_interests'] = dict(Counter(
+                repo.language for repo, _ in analyzed_repos if repo.language))
+            # Simple keyword extraction (can be improved with NLP)
+            interests_data['description_keywords'] = dict(Counter(
+                word for repo, _ in analyzed_repos if repo.description
+                for word in TECH_KEYWORD_PATTERN.findall(repo.description.lower())))
             
             # Analyze starred repositories (limited to avoid rate limits)
             try:
-                starred_repos = user.get_starred()
-                starred_count = 0
-                for starred_repo in starred_repos:
-                    if starred_count >= 50:  # Limit to avoid rate limits
-                        break
-                    
-                    topics = starred_repo.get_topics()
-                    for topic in topics:
-                        interests_data['starred_repo_topics'][topic] = interests_data['starred_repo_topics'].get(topic, 0) + 1
-                    starred_count += 1
+                # A lazy slice stops paginating after 50 starred repos and can be re-iterated on retry
+                starred_repos = self._fetch_list(user.get_starred()[:50])
+                # Topics come inline with the starred listing, so no per-repo requests
+                interests_data['starred_repo_topics'] = dict(Counter(
+                    topic for repo in starred_repos for topic in self._get_repo_topics(repo)))
                     
             except GithubException as e:
                 logging.warning(f"Error analyzing starred repos for {username}: {e}")
@@ -1222,6 +2226,73 @@ class AdvancedGitHubMiner:
             logging.error(f"Error analyzing interests for {username}: {e}")
             return {}
     
+    def _collect_user_analyses(self, username: str) -> Optional[Dict]:
+        """Run the per-user analyzers side by side, returning their results keyed as in user_data.
+        
+        Returns None if the run is stopped; analyzers that have not started yet are cancelled.
+        """
+        analyzers = [
+            ('extended_user_data', self.collect_extended_user_data, "Collecting extended user data"),
+            ('development_patterns', self.analyze_development_patterns, "Analyzing development patterns"),
+            ('commit_activity', self.analyze_commit_activity, "Analyzing commit activity"),
+            ('contribution_activity', self.analyze_contribution_activity, "Analyzing contribution activity"),
+            ('language_percentages', self.analyze_language_percentages, "Analyzing language distribution"),
+            ('top_repositories', self.get_top_repositories, "Getting top repositories"),
+            ('interests', self.analyze_interests, "Analyzing interests")
+        ]
+        # Inputs shared by several analyzers are fetched once here, so the concurrent analyzers hit the caches
+        self._get_original_repos(username)
+        self._get_repo_details(username)
+        with contextlib.suppress(GithubException):
+            # Events feed both extended user data and contribution activity; each logs its own failure
+            self._get_user_events(username)
+        
+        def run(analyzer, description):
+            # Reported when a worker picks the analyzer up, so the log follows actual progress
+            if self.progress_callback:
+                self.progress_callback(f"{description} for: {username}")
+            return analyzer(username)
+        
+        with ThreadPoolExecutor(max_workers=USER_ANALYZER_WORKERS) as executor:
+            futures = {executor.submit(run, analyzer, description): key for key, analyzer, description in analyzers}
+            for future in as_completed(futures):
+                if self.stop_event and self.stop_event.is_set():
+                    for pending in futures:
+                        pending.cancel()
+                    return None
+        return {key: future.result() for future, key in futures.items()}
+    
+    def _collect_repo_details(self, username: str, repos: List) -> List[Dict]:
+        """Collect contributor, issue and extended data for each repo, side by side, in repo order.
+        
+        Repos that fail are logged and left out, as are repos not started before a stop.
+        """
+        def collect(numbered_repo):
+            i, repo = numbered_repo
+            if self.stop_event and self.stop_event.is_set():
+                return None
+            try:
+                if self.progress_callback:
+                    self.progress_callback(f"Processing repository {i}/{len(repos)}: {repo.name}")
+                return {
+                    'name': repo.name,
+                    'stars': repo.stargazers_count,
+                    'forks': repo.forks_count,
+                    'language': repo.language,
+                    'size': repo.size,
+                    'contributor_network': self.get_contributor_network(username, repo.name),
+                    'issues': self.collect_issue_sentiment_data(username, repo.name),
+                    'extended_repo_data': self.collect_extended_repo_data(username, repo.name)
+                }
+            except Exception as e:
+                logging.error("Error processing repository %s for user %s: %s", repo.name, username, e)
+                return None
+        
+        if not repos:
+            return []
+        with ThreadPoolExecutor(max_workers=len(repos)) as executor:
+            return [repo_info for repo_info in executor.map(collect, enumerate(repos, 1)) if repo_info]
+    
     def parallel_data_collection(self, usernames: List[str], max_workers: int = 5) -> List[Dict]:
         if not usernames:
             raise ValueError("usernames list cannot be empty")
@@ -1230,64 +2301,28 @@ class AdvancedGitHubMiner:
         if max_workers < 1:
             raise ValueError("max_workers must be at least 1")
         
+        # Start each run with fresh repository lists
+        self.clear_repos_cache()
+        
+        # Resolved once per run instead of re-checking the attributes at every step of every user
+        should_stop = self.stop_event.is_set if self.stop_event else bool
+        report = self.progress_callback or (lambda message: None)
+        
         def collect_single_user(username):
             try:
-                if self.stop_event and self.stop_event.is_set():
-                    return None
-                
-                if self.progress_callback:
-                    self.progress_callback(f"Collecting data for: {username}")
-                user = self.github.get_user(username)
-                
-                if self.stop_event and self.stop_event.is_set():
+                if should_stop():
                     return None
                 
-                if self.progress_callback:
-                    self.progress_callback(f"Collecting extended user data for: {username}")
-                extended_data = self.collect_extended_user_data(username)
-                
-                if self.stop_event and self.stop_event.is_set():
-                    return None
-                
-                if self.progress_callback:
-                    self.progress_callback(f"Analyzing development patterns for: {username}")
-                development_patterns = self.analyze_development_patterns(username)
-                
-                if self.stop_event and self.stop_event.is_set():
-                    return None
-                
-                if self.progress_callback:
-                    self.progress_callback(f"Analyzing commit activity for: {username}")
-                commit_activity = self.analyze_commit_activity(username)
+                report(f"Collecting data for: {username}")
+                user = self._get_user(username)
                 
-                if self.stop_event and self.stop_event.is_set():
+                if should_stop():
                     return None
                 
-                if self.progress_callback:
-                    self.progress_callback(f"Analyzing contribution activity for: {username}")
-                contribution_activity = self.analyze_contribution_activity(username)
-                
-                if self.stop_event and self.stop_event.is_set():
+                analyses = self._collect_user_analyses(username)
+                if analyses is None:
                     return None
                 
-                if self.progress_callback:
-                    self.progress_callback(f"Analyzing language distribution for: {username}")
-                language_percentages = self.analyze_language_percentages(username)
-                
-                if self.stop_event and self.stop_event.is_set():
-                    return None
-                
-                if self.progress_callback:
-                    self.progress_callback(f"Getting top repositories for: {username}")
-                top_repositories = self.get_top_repositories(username)
-                
-                if self.stop_event and self.stop_event.is_set():
-                    return None
-                
-                if self.progress_callback:
-                    self.progress_callback(f"Analyzing interests for: {username}")
-                interests = self.analyze_interests(username)
-                
                 user_data = {
                     'username': username,
                     'name': user.name,
@@ -1295,60 +2330,28 @@ class AdvancedGitHubMiner:
                     'following': user.following,
                     'public_repos': user.public_repos,
                     'created_at': user.created_at,
-                    'extended_user_data': extended_data,
-                    'development_patterns': development_patterns,
-                    'commit_activity': commit_activity,
-                    'contribution_activity': contribution_activity,
-                    'language_percentages': language_percentages,
-                    'top_repositories': top_repositories,
-                    'interests': interests
+                    **analyses
                 }
                 
-                if self.progress_callback:
-                    self.progress_callback(f"Analyzing repositories for: {username}")
+                report(f"Analyzing repositories for: {username}")
                 
-                repos = list(user.get_repos())[:5]
+                # Up to 5 of the user's own repositories; forks are not mined
+                repos = self._get_original_repos(username)[:5]
                 if not repos:
-                    logging.info(f"No repositories found for user: {username}")
+                    logging.info("No original repositories found for user: %s", username)
                     user_data['repositories'] = []
                     return user_data
                 
-                logging.info(f"Found {len(repos)} repositories for user: {username}")
-                repo_details = []
-                for i, repo in enumerate(repos):
-                    try:
-                        if self.progress_callback:
-                            self.progress_callback(f"Processing repository {i+1}/{len(repos)}: {repo.name}")
-                        if repo.fork:
-                            logging.info(f"Skipping fork: {repo.name} for user {username}")
-                            continue
-                        
-                        repo_info = {
-                            'name': repo.name,
-                            'stars': repo.stargazers_count,
-                            'forks': repo.forks_count,
-                            'language': repo.language,
-                            'size': repo.size,
-                            'contributor_network': self.get_contributor_network(username, repo.name),
-                            'issues': self.collect_issue_sentiment_data(username, repo.name),
-                            'extended_repo_data': self.collect_extended_repo_data(username, repo.name)
-                        }
-                        repo_details.append(repo_info)
-                    except Exception as e:
-                        logging.error(f"Error processing repository {repo.name} for user {username}: {e}")
-                        continue
-                
-                user_data['repositories'] = repo_details
+                logging.info("Found %d repositories to analyze for user: %s", len(repos), username)
+                user_data['repositories'] = self._collect_repo_details(username, repos)
                 return user_data
             except GithubException as e:
-                if self.progress_callback:
-                    self.progress_callback(f"Error collecting data for {username}: {e}")
-                logging.error(f"GitHub error collecting data for {username}: {e}")
+                report(f"Error collecting data for {username}: {e}")
+                logging.error("GitHub error collecting data for %s: %s", username, e)
                 return None
             except Exception as e:
-                if self.progress_callback:
-                    self.progress_callback(f"Unexpected error for user {username}: {e}")
-                logging.error(f"Unexpected error for user {username}: {e}")
+                report(f"Unexpected error for user {username}: {e}")
+                logging.error("Unexpected error for user %s: %s", username, e)
                 return None
         
         results = []
@@ -1362,172 +2365,91 @@ class AdvancedGitHubMiner:
                     if result:
                         results.append(result)
                 except Exception as e:
-                    if self.progress_callback:
-                        self.progress_callback(f"Error processing {username}: {e}")
-                    logging.error(f"Error processing {username}: {e}")
+                    report(f"Error processing {username}: {e}")
+                    logging.error("Error processing %s: %s", username, e)
+                finally:
+                    # Every analyzer for this user has run; keep memory flat over long user lists
+                    self.clear_repos_cache(username)
         
         return results
     
-    def export_for_machine_learning(self, dataset: List[Dict], filename: str):
+    def export_for_machine_learning(self, dataset: List[Dict], filename: str, write_csv: bool = True,
+                                    csv_only: bool = False, csv_path: str = None):
         if not dataset:
             raise ValueError("dataset cannot be empty")
         if not filename or not filename.strip():
             raise ValueError("filename cannot be empty")
         
-        ml_features = []
-        for user_data in dataset:
-            if not user_data:
-                continue
-            
-            # Basic user features
-            features = {
-                'username': user_data.get('username'),
-                'name': user_data.get('name'),
-                'followers': user_data.get('followers', 0),
-                'following': user_data.get('following', 0),
-                'public_repos': user_data.get('public_repos', 0),
-                'account_age_days': 0,  # Initialize with 0
-                'mined_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            # Safely calculate account age
+        mined_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        # Feature extraction is pure CPU work; large batches are spread across processes
+        users = [user_data for user_data in dataset if user_data]
+        if len(users) >= ML_FEATURE_PROCESS_THRESHOLD and (os.cpu_count() or 1) > 1:
             try:
-                created_at = user_data.get('created_at')
-                if created_at:
-                    # Convert string to datetime if needed
-                    if isinstance(created_at, str):
-                        created_at = datetime.strptime(created_at, '%Y-%m-%dT%H:%M:%SZ')
-                    
-                    # Convert to naive datetime
-                    if created_at.tzinfo:
-                        created_at = created_at.replace(tzinfo=None)
-                    
-                    # Get current time as naive datetime
-                    current_time = datetime.now()
-                    
-                    # Calculate age
-                    features['account_age_days'] = (current_time - created_at).days
-            except Exception as e:
-                logging.warning(f"Error calculating account age: {e}")
-                features['account_age_days'] = 0
-            
-            # Extended user data
-            extended_data = user_data.get('extended_user_data', {})
-            features.update({
-                'email': extended_data.get('email'),
-                'location': extended_data.get('location'),
-                'bio': extended_data.get('bio'),
-                'company': extended_data.get('company'),
-                'blog': extended_data.get('blog'),
-                'twitter_username': extended_data.get('twitter_username'),
-                'hireable': extended_data.get('hireable'),
-                'public_gists': extended_data.get('public_gists', 0),
-                'avatar_url': extended_data.get('avatar_url'),
-                'starred_repo_count': len(extended_data.get('starred_repos', [])),
-                'watched_repo_count': len(extended_data.get('watched_repos', [])),
-                'gist_count': len(extended_data.get('gists', [])),
-                'organization_count': len(extended_data.get('organizations', [])),
-                'event_count': len(extended_data.get('events', []))
-            })
-            
-            # Development patterns
-            patterns = user_data.get('development_patterns', {})
-            if patterns:
-                features.update({
-                    'total_commits': len(patterns.get('commit_frequency', [])),
-                    'avg_commits_per_repo': np.mean([r.get('total_commits', 0) for r in patterns.get('repository_lifecycle', [])]) if patterns.get('repository_lifecycle') else 0,
-                    'max_productivity_streak': patterns.get('productivity_streaks', {}).get('max_streak', 0),
-                    'total_active_days': patterns.get('productivity_streaks', {}).get('total_active_days', 0),
-                    'languages_used': len(patterns.get('language_evolution', {})),
-                    'commit_comments_count': len(patterns.get('commit_comments', [])),
-                    'issue_comments_count': len(patterns.get('issue_comments', [])),
-                    'pr_reviews_count': len(patterns.get('pr_reviews', []))
-                })
-                
-                # Add language evolution data
-                for lang, data in patterns.get('language_evolution', {}).items():
-                    features[f'language_{lang}_bytes'] = sum(item.get('bytes', 0) for item in data)
-                    features[f'language_{lang}_repos'] = len(data)
-            
-            # Repository data
-            repos = user_data.get('repositories', [])
-            if repos:
-                features.update({
-                    'total_repos_analyzed': len(repos),
-                    'avg_repo_stars': np.mean([r.get('stars', 0) for r in repos]),
-                    'avg_repo_forks': np.mean([r.get('forks', 0) for r in repos]),
-                    'avg_repo_size': np.mean([r.get('size', 0) for r in repos]),
-                    'total_contributors': sum(len(r.get('contributor_network', {}).get('contributors', [])) for r in repos),
-                    'avg_branches': np.mean([len(r.get('extended_repo_data', {}).get('branches', [])) for r in repos]),
-                    'avg_releases': np.mean([len(r.get('extended_repo_data', {}).get('releases', [])) for r in repos]),
-                    'avg_tags': np.mean([len(r.get('extended_repo_data', {}).get('tags', [])) for r in repos]),
-                    'avg_issues': np.mean([len(r.get('issues', [])) for r in repos]),
-                    'avg_resolution_time': np.mean([issue.get('resolution_time_hours', 0) for r in repos for issue in r.get('issues', []) if issue.get('resolution_time_hours')])
-                })
-                
-                # Add repository complexity metrics
-                complexity_metrics = {
-                    'avg_lines_of_code': 0,
-                    'avg_comment_ratio': 0,
-                    'avg_function_count': 0,
-                    'avg_class_count': 0,
-                    'avg_file_count': 0
-                }
-                
-                for repo in repos:
-                    complexity = repo.get('complexity', {})
-                    if complexity:
-                        complexity_metrics['avg_lines_of_code'] += complexity.get('lines_of_code', 0)
-                        complexity_metrics['avg_comment_ratio'] += complexity.get('comment_ratio', 0)
-                        complexity_metrics['avg_function_count'] += complexity.get('function_count', 0)
-                        complexity_metrics['avg_class_count'] += complexity.get('class_count', 0)
-                        complexity_metrics['avg_file_count'] += complexity.get('file_count', 0)
-                
-                if len(repos) > 0:
-                    for key in complexity_metrics:
-                        complexity_metrics[key] /= len(repos)
-                
-                features.update(complexity_metrics)
-                
-                # Add repository-specific data
-                for i, repo in enumerate(repos):
-                    repo_name = repo.get('name', f'repo_{i}')
-                    features.update({
-                        f'{repo_name}_stars': repo.get('stars', 0),
-                        f'{repo_name}_forks': repo.get('forks', 0),
-                        f'{repo_name}_size': repo.get('size', 0),
-                        f'{repo_name}_language': repo.get('language'),
-                        f'{repo_name}_contributors': len(repo.get('contributor_network', {}).get('contributors', [])),
-                        f'{repo_name}_issues': len(repo.get('issues', [])),
-                        f'{repo_name}_branches': len(repo.get('extended_repo_data', {}).get('branches', [])),
-                        f'{repo_name}_releases': len(repo.get('extended_repo_data', {}).get('releases', [])),
-                        f'{repo_name}_tags': len(repo.get('extended_repo_data', {}).get('tags', []))
-                    })
-            
-            ml_features.append(features)
+                # Send users in chunks so pickling/IPC is paid per chunk rather than per user
+                workers = os.cpu_count()
+                chunksize = max(ML_FEATURE_MIN_CHUNKSIZE, len(users) // (workers * 4))
+                # Spawned, not forked: this process runs the GUI and thread pools, and forking a
+                # multi-threaded process can copy a held lock into the child and deadlock it
+                with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+                    ml_features = list(executor.map(extract_ml_features, users, itertools.repeat(mined_date),
+                                                    chunksize=chunksize))
+            except (OSError, TypeError, pickle.PicklingError, BrokenProcessPool) as e:
+                logging.warning(f"Process pool unavailable for feature extraction, running serially: {e}")
+                ml_features = [extract_ml_features(user_data, mined_date) for user_data in users]
+        else:
+            ml_features = [extract_ml_features(user_data, mined_date) for user_data in users]
+        
+        # Account age is computed for the whole batch once the frame is built
+        created_at_values = [user_data.get('created_at') for user_data in users]
         
         # Convert to DataFrame and handle any non-serializable values
         df = pd.DataFrame(ml_features)
-        for col in df.columns:
-            df[col] = df[col].apply(lambda x: str(x) if isinstance(x, (dict, list)) else x)
+        if not df.empty:
+            df['account_age_days'] = _account_age_days(created_at_values)
+        _stringify_nested_cells(df)
+        
+        # Append to CSV file (written in row batches instead of one big string)
+        # An explicit csv_path gets a fresh file; otherwise rows are appended to the shared feature CSV
+        csv_file = None
+        if write_csv or csv_only or pyarrow is None:
+            csv_file = csv_path or "github_data_ml_features.csv"
+            append = csv_path is None and os.path.exists(csv_file)
+            with open(csv_file, 'a' if append else 'w', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+                df.to_csv(f, header=not append, index=False, chunksize=10_000)
+        
+        # Keep a typed, compressed Parquet copy of the features when pyarrow is installed.
+        # Parts may differ in their per-repo/language columns; concatenate the part files to read them all.
+        parquet_file = None
+        if pyarrow is not None and not csv_only:
+            os.makedirs(PARQUET_DATASET_DIR, exist_ok=True)
+            part_name = f"part-{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:8]}.parquet"
+            parquet_file = os.path.join(PARQUET_DATASET_DIR, part_name)
+            # Written under a dot-prefixed name (skipped by Parquet dataset readers) and renamed
+            # into place, so a crash never leaves a truncated part behind
+            tmp_file = os.path.join(PARQUET_DATASET_DIR, f".{part_name}.tmp")
+            try:
+                _with_feature_dtypes(df).to_parquet(tmp_file, engine='pyarrow', compression='zstd', index=False)
+                os.replace(tmp_file, parquet_file)
+            except Exception as e:
+                logging.warning(f"Error writing Parquet features to {parquet_file}: {e}")
+                parquet_file = None
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_file)
         
-        # Append to CSV file
-        csv_file = "github_data_ml_features.csv"
-        if os.path.exists(csv_file):
-            df.to_csv(csv_file, mode='a', header=False, index=False)
-        else:
-            df.to_csv(csv_file, index=False)
+        if csv_only:
+            print(f"Data written to: {csv_file}")
+            return
         
-        # Append to JSON file
-        json_file = "github_data_raw.json"
-        if os.path.exists(json_file):
-            with open(json_file, 'r') as f:
-                try:
-                    existing_data = json.load(f)
-                except json.JSONDecodeError:
-                    existing_data = []
-        else:
-            existing_data = []
+        # Append to the JSON Lines file; earlier runs' records are never re-read or rewritten
+        json_file = RAW_DATA_FILE
+        legacy_data = []
+        if not os.path.exists(json_file) and os.path.exists(LEGACY_RAW_DATA_FILE):
+            try:
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                legacy_data = _load_json_file(LEGACY_RAW_DATA_FILE)
+            except json.JSONDecodeError:
+                legacy_data = []
         
         # Convert datetime objects to strings before JSON serialization
         def datetime_handler(obj):
@@ -1535,19 +2457,61 @@ class AdvancedGitHubMiner:
                 return obj.strftime('%Y-%m-%dT%H:%M:%SZ')
             raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
         
-        existing_data.extend(dataset)
-        
-        with open(json_file, 'w') as f:
-            json.dump(existing_data, f, indent=2, default=datetime_handler)
+        records = itertools.chain(legacy_data, dataset)
+        if orjson is not None:
+            # orjson serializes datetimes and numpy values natively, without Python callbacks
+            with open(json_file, 'ab', buffering=IO_BUFFER_SIZE) as f:
+                for record in records:
+                    f.write(orjson.dumps(record, default=datetime_handler, option=ORJSON_JSONL_OPTIONS))
+        else:
+            with open(json_file, 'a', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+                for record in records:
+                    f.write(json.dumps(record, default=datetime_handler) + '\n')
         
-        print(f"Data appended to: {csv_file} and {json_file}")
+        feature_files = ', '.join(f for f in (csv_file, parquet_file) if f)
+        print(f"Data appended to: {feature_files} and {json_file}")
+    
+    def _convert_jsonl_to_csv(self, json_file_path: str, output_csv_path: str) -> int:
+        """Stream JSONL user records into a feature CSV without loading the whole dataset."""
+        mined_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        # Per-repo columns differ between users, so a first pass collects the full header
+        fieldnames = {}
+        for user_data in _iter_jsonl(json_file_path):
+            if user_data:
+                fieldnames.update(dict.fromkeys(extract_ml_features(user_data, mined_date)))
+        
+        columns = list(fieldnames)
+        rows_written = 0
+        with open(output_csv_path, 'w', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+            pd.DataFrame(columns=columns).to_csv(f, index=False)
+            
+            # Each batch goes through pandas' C CSV writer rather than a per-row Python loop
+            records = (user_data for user_data in _iter_jsonl(json_file_path) if user_data)
+            while batch := list(itertools.islice(records, CSV_STREAM_BATCH_SIZE)):
+                batch_df = pd.DataFrame([extract_ml_features(user_data, mined_date) for user_data in batch], columns=columns)
+                batch_df['account_age_days'] = _account_age_days([user_data.get('created_at') for user_data in batch])
+                _stringify_nested_cells(batch_df)
+                batch_df.to_csv(f, header=False, index=False)
+                rows_written += len(batch_df)
+        
+        return rows_written
     
     def convert_json_to_csv(self, json_file_path: str, output_csv_path: str = None) -> str:
         """Convert a JSON file containing GitHub user data to CSV format."""
         try:
+            # Newline-delimited exports are streamed one record at a time
+            if _is_jsonl(json_file_path):
+                if output_csv_path is None:
+                    output_csv_path = f"{os.path.splitext(json_file_path)[0]}_converted.csv"
+                if not self._convert_jsonl_to_csv(json_file_path, output_csv_path):
+                    raise ValueError("JSON file is empty or invalid")
+                
+                logging.info(f"JSONL to CSV conversion completed: {output_csv_path}")
+                return output_csv_path
+            
             # Load JSON data
-            with open(json_file_path, 'r') as f:
-                dataset = json.load(f)
+            dataset = _load_json_file(json_file_path)
             
             if not dataset:
                 raise ValueError("JSON file is empty or invalid")
@@ -1557,9 +2521,8 @@ class AdvancedGitHubMiner:
                 base_name = json_file_path.replace('.json', '')
                 output_csv_path = f"{base_name}_converted.csv"
             
-            # Use the existing export function to convert
-            temp_filename = json_file_path.replace('.json', '').replace('_raw', '')
-            self.export_for_machine_learning(dataset, temp_filename + "_converted")
+            # Features only: the raw JSON is the input, so it is not re-serialized
+            self.export_for_machine_learning(dataset, output_csv_path, csv_only=True, csv_path=output_csv_path)
             
             logging.info(f"JSON to CSV conversion completed: {output_csv_path}")
             return output_csv_path
@@ -1568,172 +2531,39 @@ class AdvancedGitHubMiner:
             logging.error(f"Error converting JSON to CSV: {e}")
             raise
     
-    def mine_repository_contributors(self, repo_url: str) -> List[Dict]:
-        """Mine data for all contributors of a repository."""
+    def mine_repository_contributors(self, repo_url: str, max_contributors: int = 100) -> List[Dict]:
+        """Mine data for the top max_contributors contributors of a repository."""
         if not repo_url:
             raise ValueError("Repository URL cannot be empty")
+        if max_contributors < 1:
+            raise ValueError("max_contributors must be at least 1")
             
         # Extract owner and repo name from URL
-        pattern = r'github\.com/([^/]+)/([^/]+)'
-        match = re.search(pattern, repo_url)
+        match = GITHUB_REPO_URL_PATTERN.search(repo_url)
         if not match:
             raise ValueError("Invalid GitHub repository URL")
             
         owner, repo_name = match.groups()
         
         try:
-            repo = self.github.get_repo(f"{owner}/{repo_name}")
-            contributors = list(repo.get_contributors())
+            repo = self._get_repo(f"{owner}/{repo_name}")
+            if self.etag_cache is not None:
+                usernames = self._fetch_contributor_logins(repo.full_name, max_contributors)
+            else:
+                # A lazy slice only requests the pages covering the cap, not every contributor
+                contributors = self._fetch_list(repo.get_contributors()[:max_contributors])
+                usernames = [contrib.login for contrib in contributors]
             
             if self.progress_callback:
-                self.progress_callback(f"Found {len(contributors)} contributors in {owner}/{repo_name}")
+                self.progress_callback(f"Found {len(usernames)} contributors in {owner}/{repo_name}")
             
-            # Collect usernames of all contributors
-            usernames = [contrib.login for contrib in contributors]
-            
-            # Use parallel_data_collection to get data for all contributors
-            results = []
-            for username in usernames:
-                try:
-                    if self.progress_callback:
-                        self.progress_callback(f"Collecting data for: {username}")
-                    
-                    # Collect data for single user
-                    user_data = self.collect_single_user(username)
-                    if user_data:
-                        results.append(user_data)
-                        
-                except Exception as e:
-                    if self.progress_callback:
-                        self.progress_callback(f"Error collecting data for {username}: {str(e)}")
-                    logging.error(f"Error collecting data for {username}: {e}")
-                    continue
+            if not usernames:
+                return []
             
-            return results
+            return self.parallel_data_collection(usernames, max_workers=min(10, len(usernames)))
             
         except GithubException as e:
             raise ValueError(f"Error accessing repository: {e}")
-    
-    def collect_single_user(self, username: str) -> Dict:
-        """Collect data for a single user."""
-        try:
-            if self.stop_event and self.stop_event.is_set():
-                return None
-            
-            user = self.github.get_user(username)
-            
-            if self.progress_callback:
-                self.progress_callback(f"Collecting extended user data for: {username}")
-            extended_data = self.collect_extended_user_data(username)
-            
-            if self.stop_event and self.stop_event.is_set():
-                return None
-            
-            if self.progress_callback:
-                self.progress_callback(f"Analyzing development patterns for: {username}")
-            development_patterns = self.analyze_development_patterns(username)
-            
-            if self.stop_event and self.stop_event.is_set():
-                return None
-            
-            if self.progress_callback:
-                self.progress_callback(f"Analyzing commit activity for: {username}")
-            commit_activity = self.analyze_commit_activity(username)
-            
-            if self.stop_event and self.stop_event.is_set():
-                return None
-            
-            if self.progress_callback:
-                self.progress_callback(f"Analyzing contribution activity for: {username}")
-            contribution_activity = self.analyze_contribution_activity(username)
-            
-            if self.stop_event and self.stop_event.is_set():
-                return None
-            
-            if self.progress_callback:
-                self.progress_callback(f"Analyzing language distribution for: {username}")
-            language_percentages = self.analyze_language_percentages(username)
-            
-            if self.stop_event and self.stop_event.is_set():
-                return None
-            
-            if self.progress_callback:
-                self.progress_callback(f"Getting top repositories for: {username}")
-            top_repositories = self.get_top_repositories(username)
-            
-            if self.stop_event and self.stop_event.is_set():
-                return None
-            
-            if self.progress_callback:
-                self.progress_callback(f"Analyzing interests for: {username}")
-            interests = self.analyze_interests(username)
-            
-            user_data = {
-                'username': username,
-                'name': user.name,
-                'followers': user.followers,
-                'following': user.following,
-                'public_repos': user.public_repos,
-                'created_at': user.created_at,
-                'extended_user_data': extended_data,
-                'development_patterns': development_patterns,
-                'commit_activity': commit_activity,
-                'contribution_activity': contribution_activity,
-                'language_percentages': language_percentages,
-                'top_repositories': top_repositories,
-                'interests': interests
-            }
-            
-            if self.progress_callback:
-                self.progress_callback(f"Analyzing repositories for: {username}")
-            
-            # Get all repositories and filter out forks
-            all_repos = list(user.get_repos())
-            original_repos = [repo for repo in all_repos if not repo.fork]
-            
-            if not original_repos:
-                logging.info(f"No original repositories found for user: {username}")
-                user_data['repositories'] = []
-                return user_data
-            
-            # Take up to 5 repositories, or all if less than 5
-            repos_to_analyze = original_repos[:min(5, len(original_repos))]
-            logging.info(f"Found {len(repos_to_analyze)} repositories to analyze for user: {username}")
-            
-            repo_details = []
-            for i, repo in enumerate(repos_to_analyze):
-                try:
-                    if self.progress_callback:
-                        self.progress_callback(f"Processing repository {i+1}/{len(repos_to_analyze)}: {repo.name}")
-                    
-                    repo_info = {
-                        'name': repo.name,
-                        'stars': repo.stargazers_count,
-                        'forks': repo.forks_count,
-                        'language': repo.language,
-                        'size': repo.size,
-                        'contributor_network': self.get_contributor_network(username, repo.name),
-                        'issues': self.collect_issue_sentiment_data(username, repo.name),
-                        'extended_repo_data': self.collect_extended_repo_data(username, repo.name)
-                    }
-                    repo_details.append(repo_info)
-                except Exception as e:
-                    logging.error(f"Error processing repository {repo.name} for user {username}: {e}")
-                    continue
-            
-            user_data['repositories'] = repo_details
-            return user_data
-            
-        except GithubException as e:
-            if self.progress_callback:
-                self.progress_callback(f"GitHub error collecting data for {username}: {e}")
-            logging.error(f"GitHub error collecting data for {username}: {e}")
-            return None
-        except Exception as e:
-            if self.progress_callback:
-                self.progress_callback(f"Unexpected error for user {username}: {e}")
-            logging.error(f"Unexpected error for user {username}: {e}")
-            return None
 
 class GitHubMinerGUI:
     def __init__(self, root):
@@ -1741,6 +2571,7 @@ class GitHubMinerGUI:
         self.root.title("GitHub Profile Miner")
         self.stop_event = threading.Event()
         self.mining_thread = None
+        self.token = GITHUB_TOKEN
         
         # Create main frame
         self.main_frame = ttk.Frame(root, padding="10")
@@ -1775,9 +2606,13 @@ class GitHubMinerGUI:
         self.progress_bar.pack(fill=tk.X, pady=5)
         
         # Status text (shared between tabs)
-        self.status_text = tk.Text(self.main_frame, height=10, width=80)
+        self.status_text = tk.Text(self.main_frame, height=10, width=80, undo=False, maxundo=0)
         self.status_text.pack(pady=10, fill=tk.BOTH, expand=True)
         
+        # Worker threads queue status messages; only the Tk thread touches the widget
+        self.status_queue = queue.Queue()
+        self.root.after(STATUS_POLL_MS, self._drain_status_queue)
+        
         # Control buttons (shared)
         self.control_frame = ttk.Frame(self.main_frame)
         self.control_frame.pack(pady=5)
@@ -2002,7 +2837,7 @@ class GitHubMinerGUI:
     def auto_discovery_worker(self, discovery_type):
         """Worker for predefined auto discovery."""
         try:
-            token = self.auto_token_entry.get() or self.entry_token.get() or GITHUB_TOKEN
+            token = self.auto_token_entry.get() or self.entry_token.get() or self.token
             if not token:
                 raise ValueError("GitHub token is required")
             
@@ -2063,7 +2898,7 @@ class GitHubMinerGUI:
     def custom_discovery_worker(self, params):
         """Worker for custom auto discovery."""
         try:
-            token = self.auto_token_entry.get() or self.entry_token.get() or GITHUB_TOKEN
+            token = self.auto_token_entry.get() or self.entry_token.get() or self.token
             if not token:
                 raise ValueError("GitHub token is required")
             
@@ -2135,7 +2970,9 @@ class GitHubMinerGUI:
     def mine_discovered_users(self, usernames, output_prefix):
         """Mine data for discovered users."""
         try:
-            token = self.auto_token_entry.get() or self.entry_token.get() or GITHUB_TOKEN
+            token = self.auto_token_entry.get() or self.entry_token.get() or self.token
+            # The discovery field may hold a comma-separated token pool; mining uses the first one
+            token = token.split(',')[0].strip()
             
             def progress_callback(message):
                 self.update_status(message)
@@ -2154,6 +2991,7 @@ class GitHubMinerGUI:
                 self.update_status(f"Processing batch {i//batch_size + 1}/{(len(usernames) + batch_size - 1)//batch_size}: {', '.join(batch)}")
                 
                 try:
+                    remaining_before = miner.last_rate_limit[0]
                     batch_results = miner.parallel_data_collection(batch, max_workers=2)
                     all_results.extend(batch_results)
                     
@@ -2162,13 +3000,12 @@ class GitHubMinerGUI:
                         miner.export_for_machine_learning(batch_results, "github_data")
                         self.update_status(f"Batch {i//batch_size + 1} completed and saved")
                     
-                    # Rate limiting delay
+                    # Pace batches by the quota left rather than a fixed delay
                     if i + batch_size < len(usernames) and not self.stop_event.is_set():
-                        self.update_status("Waiting 30 seconds to avoid rate limits...")
-                        for _ in range(30):
-                            if self.stop_event.is_set():
-                                break
-                            time.sleep(1)
+                        delay = _batch_pause(miner, remaining_before - miner.last_rate_limit[0])
+                        if delay >= 1:
+                            self.update_status(f"Waiting {delay:.0f} seconds to avoid rate limits...")
+                        self.stop_event.wait(delay)
                         
                 except Exception as e:
                     self.update_status(f"Error processing batch {i//batch_size + 1}: {e}")
@@ -2203,18 +3040,30 @@ class GitHubMinerGUI:
         self.status_text.delete(1.0, tk.END)
     
     def update_status(self, message):
-        """Update the status text with a new message."""
-        self.status_text.insert(tk.END, f"[{datetime.now().strftime('%H:%M:%S')}] {message}\n")
-        self.status_text.see(tk.END)
-        self.root.update_idletasks()
+        """Queue a status message; safe to call from worker threads."""
+        self.status_queue.put_nowait(f"[{datetime.now().strftime('%H:%M:%S')}] {message}\n")
+    
+    def _drain_status_queue(self):
+        """Append queued status messages to the log on the Tk thread, then reschedule."""
+        lines = []
+        while len(lines) < STATUS_DRAIN_BATCH:
+            try:
+                lines.append(self.status_queue.get_nowait())
+            except queue.Empty:
+                break
+        if lines:
+            # One insert and one scroll per batch instead of per message
+            self.status_text.insert(tk.END, ''.join(lines))
+            self.status_text.delete('1.0', f'end-{STATUS_MAX_LINES}lines')
+            self.status_text.see(tk.END)
+        self.root.after(STATUS_POLL_MS, self._drain_status_queue)
     
     def set_global_token(self):
-        global GITHUB_TOKEN
         token = self.entry_token.get() or self.repo_entry_token.get()
         if not token or token.strip() == "":
             messagebox.showerror("Error", "Token cannot be empty")
             return
-        GITHUB_TOKEN = token
+        self.token = token
         messagebox.showinfo("Success", "Global token has been set!")
     
     def start_profile_mining(self):
@@ -2237,7 +3086,7 @@ class GitHubMinerGUI:
     
     def mine_profile(self):
         try:
-            token = self.entry_token.get()
+            token = self.entry_token.get() or self.token
             profile_url = self.entry_url.get()
             
             username = self.extract_username(profile_url)
@@ -2268,7 +3117,7 @@ class GitHubMinerGUI:
     
     def mine_repository(self):
         try:
-            token = self.repo_entry_token.get()
+            token = self.repo_entry_token.get() or self.token
             repo_url = self.repo_entry_url.get()
             
             self.update_status(f"Starting mining for repository: {repo_url}")
@@ -2301,8 +3150,7 @@ class GitHubMinerGUI:
         url = url.strip()
         if not url:
             raise ValueError("Profile URL cannot be empty")
-        pattern = r'github\.com/([a-zA-Z0-9-]+)'
-        match = re.search(pattern, url)
+        match = GITHUB_USERNAME_PATTERN.search(url)
         if not match:
             raise ValueError("Invalid GitHub profile URL")
         return match.group(1)
@@ -2317,7 +3165,7 @@ def cli_auto_discovery():
     import argparse
     
     parser = argparse.ArgumentParser(description='GitHub Developer Analyzer - Automated Discovery & Mining')
-    parser.add_argument('--token', required=True, help='GitHub API token')
+    parser.add_argument('--token', required=True, help='GitHub API token (comma-separate several to pool their rate limits)')
     parser.add_argument('--mode', choices=['quick', 'custom', 'comprehensive'], required=True, 
                        help='Discovery mode: quick, custom, or comprehensive')
     
@@ -2472,7 +3320,7 @@ def cli_auto_discovery():
         def progress_callback(message):
             print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
         
-        miner = AdvancedGitHubMiner(args.token, progress_callback=progress_callback)
+        miner = AdvancedGitHubMiner(discoverer.token, progress_callback=progress_callback)
         
         # Process in batches
         batch_size = args.batch_size
@@ -2486,6 +3334,7 @@ def cli_auto_discovery():
             print(f"\nProcessing batch {batch_num}/{total_batches}: {', '.join(batch)}")
             
             try:
+                remaining_before = miner.last_rate_limit[0]
                 batch_results = miner.parallel_data_collection(batch, max_workers=2)
                 all_results.extend(batch_results)
                 
@@ -2496,10 +3345,12 @@ def cli_auto_discovery():
                     miner.export_for_machine_learning(batch_results, intermediate_file)
                     print(f"Batch {batch_num} completed and saved as {intermediate_file}")
                 
-                # Rate limiting delay
+                # Pace batches by the quota left rather than a fixed delay
                 if i + batch_size < len(discovered_users):
-                    print("Waiting 30 seconds to avoid rate limits...")
-                    time.sleep(30)
+                    delay = _batch_pause(miner, remaining_before - miner.last_rate_limit[0])
+                    if delay >= 1:
+                        print(f"Waiting {delay:.0f} seconds to avoid rate limits...")
+                    time.sleep(delay)
                     
             except Exception as e:
                 print(f"Error processing batch {batch_num}: {e}")
@@ -2546,8 +3397,8 @@ def debug_export_function(dataset_file: str = None):
     """Debug function to test the export functionality."""
     try:
         if dataset_file:
-            with open(dataset_file, 'r') as f:
-                dataset = json.load(f)
+            # Accepts the JSON Lines raw output as well as the older single-array files
+            dataset = list(_iter_jsonl(dataset_file)) if _is_jsonl(dataset_file) else _load_json_file(dataset_file)
         else:
             # Create a sample dataset for testing
             dataset = [{
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the ETag response cache (ETagCache and AdvancedGitHubMiner._conditional_get).
+No network access or GitHub token is needed; GitHub's responses are faked.
+"""
+
+import os
+import tempfile
+import time
+from unittest import mock
+
+import main
+from main import AdvancedGitHubMiner, ETagCache
+
+
+class FakeRequester:
+    """Answers GETs with a fixed ETag, or with a 304 (no body) when If-None-Match matches it."""
+
+    def __init__(self, etag='"v1"'):
+        self.etag = etag
+        self.calls = []
+
+    def requestJsonAndCheck(self, verb, url, parameters=None, headers=None):
+        self.calls.append((url, dict(headers or {})))
+        if headers and headers.get('If-None-Match') == self.etag:
+            return {}, None
+        return {'etag': self.etag}, {'url': url, 'call': len(self.calls)}
+
+
+def make_miner(token, cache):
+    """Build a miner without contacting GitHub, using the given ETag cache and a fake requester."""
+    with mock.patch.object(main, 'Github'):
+        miner = AdvancedGitHubMiner(token, use_etag_cache=False)
+    miner.github.rate_limiting = (5000, 5000)
+    miner.github.rate_limiting_resettime = 0
+    miner.github.requester = FakeRequester()
+    miner.etag_cache = cache
+    return miner
+
+
+def test_etag_cache_roundtrip_and_touch():
+    """Stored bodies come back intact, and touch() marks them fresh again."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ETagCache(os.path.join(tmp, 'etags.sqlite'))
+        assert cache.get('/users/octocat') is None
+
+        cache.set('/users/octocat', '"abc"', {'login': 'octocat', 'public_repos': 8})
+        etag, body, fetched_at = cache.get('/users/octocat')
+        assert etag == '"abc"'
+        assert body == {'login': 'octocat', 'public_repos': 8}
+
+        time.sleep(0.01)
+        cache.touch('/users/octocat')
+        assert cache.get('/users/octocat')[2] > fetched_at
+
+        cache.close()
+        cache.close()  # closing twice is harmless
+
+
+def test_conditional_get_ttl_and_revalidation():
+    """Fresh entries skip the request; stale ones are revalidated and a 304 serves the cached body."""
+    with tempfile.TemporaryDirectory() as tmp:
+        miner = make_miner('token-a', ETagCache(os.path.join(tmp, 'etags.sqlite')))
+        requester = miner.github.requester
+
+        first = miner._conditional_get('/users/octocat', {}, ttl=60)
+        assert len(requester.calls) == 1
+
+        # Within the TTL nothing is sent
+        assert miner._conditional_get('/users/octocat', {}, ttl=60) == first
+        assert len(requester.calls) == 1
+
+        # Past the TTL the request carries If-None-Match and the 304 returns the cached body
+        assert miner._conditional_get('/users/octocat', {}, ttl=0) == first
+        assert len(requester.calls) == 2
+        assert requester.calls[1][1].get('If-None-Match') == requester.etag
+        miner.close()
+
+
+def test_cache_keys_are_namespaced_by_token():
+    """A response cached for one token is never served to another token."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'etags.sqlite')
+        miner_a = make_miner('token-a', ETagCache(path))
+        miner_b = make_miner('token-b', ETagCache(path))
+
+        miner_a._conditional_get('/users/octocat', {}, ttl=3600)
+        miner_b._conditional_get('/users/octocat', {}, ttl=3600)
+
+        # Token B had to make its own unconditional request
+        assert len(miner_b.github.requester.calls) == 1
+        assert 'If-None-Match' not in miner_b.github.requester.calls[0][1]
+        miner_a.close()
+        miner_b.close()
+
+
+def test_viewer_specific_responses_are_not_cached():
+    """Endpoints that can return the token owner's private data always go to GitHub and are not stored."""
+    with tempfile.TemporaryDirectory() as tmp:
+        miner = make_miner('token-a', ETagCache(os.path.join(tmp, 'etags.sqlite')))
+
+        for _ in range(2):
+            miner._conditional_get('/users/octocat/events', {'per_page': 100}, ttl=3600, viewer_specific=True)
+
+        assert len(miner.github.requester.calls) == 2
+        assert all('If-None-Match' not in headers for _, headers in miner.github.requester.calls)
+        count = miner.etag_cache._conn.execute("SELECT COUNT(*) FROM etags").fetchone()[0]
+        assert count == 0
+        miner.close()
+
+
+if __name__ == "__main__":
+    print("🚀 GitHub Miner - ETag Cache Tests")
+    print("=" * 60)
+
+    for test in (test_etag_cache_roundtrip_and_touch, test_conditional_get_ttl_and_revalidation,
+                 test_cache_keys_are_namespaced_by_token, test_viewer_specific_responses_are_not_cached):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the JSON Lines raw-data export and the JSON/JSONL to CSV conversion.
+"""
+
+import contextlib
+import json
+import os
+import tempfile
+from unittest import mock
+
+import pandas as pd
+
+import main
+from main import AdvancedGitHubMiner
+
+
+def sample_users():
+    """Two small mined records, one with a repository and non-ASCII text."""
+    return [
+        {
+            'username': 'alice',
+            'name': 'Alice Müller',
+            'followers': 12,
+            'following': 3,
+            'public_repos': 1,
+            'created_at': '2015-06-01T10:00:00Z',
+            'extended_user_data': {'location': 'Zürich', 'starred_repos': [{'full_name': 'a/b', 'stars': 5}]},
+            'repositories': [{'name': 'tool', 'stars': 4, 'forks': 1, 'size': 120, 'language': 'Python', 'issues': []}]
+        },
+        {
+            'username': 'bob',
+            'name': '鲍勃',
+            'followers': 0,
+            'following': 0,
+            'public_repos': 0,
+            'created_at': '2020-01-15T08:30:00Z',
+            'repositories': []
+        }
+    ]
+
+
+def make_miner():
+    """Build a miner without contacting GitHub."""
+    with mock.patch.object(main, 'Github'):
+        return AdvancedGitHubMiner('token', use_etag_cache=False)
+
+
+@contextlib.contextmanager
+def in_temp_dir():
+    """Run with a fresh temporary working directory, since exports write next to the caller."""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            yield tmp
+        finally:
+            os.chdir(cwd)
+
+
+def read_jsonl(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_legacy_json_is_carried_over_once():
+    """The first JSONL export carries the legacy array's records over and leaves the old file untouched."""
+    legacy = [{'username': 'legacy-user', 'followers': 1}]
+    with in_temp_dir():
+        with open(main.LEGACY_RAW_DATA_FILE, 'w', encoding='utf-8') as f:
+            json.dump(legacy, f)
+
+        miner = make_miner()
+        users = sample_users()
+        miner.export_for_machine_learning(users[:1], "github_data")
+        assert [r['username'] for r in read_jsonl(main.RAW_DATA_FILE)] == ['legacy-user', 'alice']
+
+        # Later exports only append their own records
+        miner.export_for_machine_learning(users[1:], "github_data")
+        assert [r['username'] for r in read_jsonl(main.RAW_DATA_FILE)] == ['legacy-user', 'alice', 'bob']
+
+        with open(main.LEGACY_RAW_DATA_FILE, encoding='utf-8') as f:
+            assert json.load(f) == legacy
+
+
+def test_array_and_jsonl_convert_to_the_same_csv():
+    """convert_json_to_csv produces the same features whether the input is a JSON array or JSON Lines."""
+    users = sample_users()
+    with in_temp_dir():
+        with open('users.json', 'w', encoding='utf-8') as f:
+            json.dump(users, f)
+        with open('users.jsonl', 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps(user) + '\n' for user in users)
+
+        miner = make_miner()
+        array_csv = miner.convert_json_to_csv('users.json', 'from_array.csv')
+        jsonl_csv = miner.convert_json_to_csv('users.jsonl', 'from_jsonl.csv')
+
+        # mined_date is the conversion time, so it is left out of the comparison
+        from_array = pd.read_csv(array_csv, encoding='utf-8').drop(columns='mined_date')
+        from_jsonl = pd.read_csv(jsonl_csv, encoding='utf-8').drop(columns='mined_date')
+        pd.testing.assert_frame_equal(from_array, from_jsonl)
+        assert list(from_array['name']) == ['Alice Müller', '鲍勃']
+
+
+if __name__ == "__main__":
+    print("🚀 GitHub Miner - Raw Data Export Tests")
+    print("=" * 60)
+
+    for test in (test_legacy_json_is_carried_over_once, test_array_and_jsonl_convert_to_the_same_csv):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the per-user analyzer cache (cached_per_user).
+"""
+
+import threading
+from collections import OrderedDict
+from unittest import mock
+
+import main
+from main import cached_per_user
+
+
+class FakeAnalyzer:
+    """Minimal stand-in for AdvancedGitHubMiner carrying the state cached_per_user relies on."""
+
+    def __init__(self):
+        self._user_cache = OrderedDict()
+        self._user_cache_lock = threading.Lock()
+        self.stop_event = None
+        self.calls = 0
+
+    @cached_per_user
+    def analyze(self, username, depth=1):
+        self.calls += 1
+        return {'username': username, 'depth': depth} if username != 'ghost' else {}
+
+
+def test_results_are_memoized_per_user_and_arguments():
+    """Repeated calls are served from the cache; other users or arguments are analyzed separately."""
+    analyzer = FakeAnalyzer()
+    assert analyzer.analyze('alice') == analyzer.analyze('alice')
+    assert analyzer.calls == 1
+
+    analyzer.analyze('alice', depth=2)
+    analyzer.analyze('bob')
+    assert analyzer.calls == 3
+
+
+def test_empty_and_stopped_results_are_not_cached():
+    """Empty results (API errors) and results of a stopped run are fetched again next time."""
+    analyzer = FakeAnalyzer()
+    analyzer.analyze('ghost')
+    analyzer.analyze('ghost')
+    assert analyzer.calls == 2
+
+    analyzer.stop_event = threading.Event()
+    analyzer.stop_event.set()
+    analyzer.analyze('alice')
+    assert len(analyzer._user_cache) == 0
+
+
+def test_entries_expire_after_ttl():
+    """An entry older than USER_CACHE_TTL is recomputed and pruned."""
+    analyzer = FakeAnalyzer()
+    with mock.patch.object(main.time, 'time', return_value=1000.0):
+        analyzer.analyze('alice')
+    with mock.patch.object(main.time, 'time', return_value=1000.0 + main.USER_CACHE_TTL):
+        analyzer.analyze('alice')
+    assert analyzer.calls == 2
+    assert len(analyzer._user_cache) == 1
+
+
+def test_cache_is_bounded_least_recently_used_first():
+    """At most USER_CACHE_MAX_ENTRIES are kept, evicting the least recently used entry."""
+    analyzer = FakeAnalyzer()
+    with mock.patch.object(main, 'USER_CACHE_MAX_ENTRIES', 2):
+        analyzer.analyze('alice')
+        analyzer.analyze('bob')
+        analyzer.analyze('alice')  # alice is now the most recently used
+        analyzer.analyze('carol')  # evicts bob
+        cached_users = [key[1] for key in analyzer._user_cache]
+    assert cached_users == ['alice', 'carol']
+
+
+def test_concurrent_access_keeps_the_bound():
+    """Many threads reading and writing the cache at once never exceed the bound or raise."""
+    analyzer = FakeAnalyzer()
+    errors = []
+
+    def worker(offset):
+        try:
+            for i in range(200):
+                analyzer.analyze(f"user{(offset + i) % 50}")
+        except Exception as e:
+            errors.append(e)
+
+    with mock.patch.object(main, 'USER_CACHE_MAX_ENTRIES', 10):
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert not errors
+    assert len(analyzer._user_cache) <= 10
+
+
+if __name__ == "__main__":
+    print("🚀 GitHub Miner - Analyzer Cache Tests")
+    print("=" * 60)
+
+    for test in (test_results_are_memoized_per_user_and_arguments, test_empty_and_stopped_results_are_not_cached,
+                 test_entries_expire_after_ttl, test_cache_is_bounded_least_recently_used_first,
+                 test_concurrent_access_keeps_the_bound):
+        test()
+        print(f"✅ {test.__name__}")